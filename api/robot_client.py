@@ -1118,12 +1118,13 @@ def get_robot_pose():
                 if len(pose_values) == 16:
                     # Convert 4x4 matrix to [x,y,z,r,p,y]
                     import numpy as np
-                    from spatialmath import SE3
-                    
+                    from scipy.spatial.transform import Rotation
+
                     pose_matrix = np.array(pose_values).reshape((4, 4))
-                    T = SE3(pose_matrix, check=False)
-                    xyz_mm = T.t * 1000  # Convert to mm
-                    rpy_deg = T.rpy(unit='deg', order='xyz')
+                    xyz_mm = pose_matrix[:3, 3] * 1000  # Convert to mm
+                    # Extrinsic 'zyx' matches spatialmath rpy(order='xyz')
+                    # without the SE3 wrapper round trip
+                    rpy_deg = Rotation.from_matrix(pose_matrix[:3, :3]).as_euler('zyx', degrees=True)
                     
                     # Convert numpy float64 to regular Python floats
                     return [float(x) for x in xyz_mm] + [float(r) for r in rpy_deg]
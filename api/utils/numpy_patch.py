@@ -1,9 +1,16 @@
 """
 Monkey patch for numpy.disp which was removed in numpy 2.0
 This adds back the disp function for compatibility with older code
+
+Importing the module applies the patch once; apply() is the explicit
+entry point and is safe to call repeatedly (dev-server reloads re-import
+this module, and the sentinel keeps the hasattr probe and setattr from
+re-running).
 """
 import numpy as np
 
+_APPLIED = False
+
 # Add the deprecated disp function back to numpy
 def disp(mesg):
     """
@@ -19,6 +26,13 @@ def disp(mesg):
     """
     print(mesg)
 
-# Monkey-patch numpy
-if not hasattr(np, 'disp'):
-    np.disp = disp
+def apply():
+    """Monkey-patch numpy, once per process."""
+    global _APPLIED
+    if _APPLIED:
+        return
+    if not hasattr(np, 'disp'):
+        np.disp = disp
+    _APPLIED = True
+
+apply()
@@ -30,6 +30,10 @@ class ConnectionManager:
         # Log level filters per client
         self.log_filters: Dict[str, str] = {}  # client_id -> min log level
 
+        # Last serialized payload per client and channel, for change-gated
+        # broadcasts (client_id -> {channel: payload})
+        self._last_payload: Dict[str, Dict[str, str]] = {}
+
         # Load frontend log level from config
         self.frontend_log_level = self._load_frontend_log_level()
 
@@ -61,6 +65,9 @@ class ConnectionManager:
         self.update_rates[client_id] = 10  # Default 10Hz
         self.last_update[client_id] = datetime.now()
         self.log_filters[client_id] = 'INFO'  # Default log level
+        # Fresh change gate so the new client receives a full state
+        # snapshot on the next broadcast cycle
+        self._last_payload[client_id] = {}
         logger.debug(f"Client {client_id} connected")
         
     def disconnect(self, client_id: str):
@@ -71,6 +78,7 @@ class ConnectionManager:
             del self.update_rates[client_id]
             del self.last_update[client_id]
             del self.log_filters[client_id]
+            self._last_payload.pop(client_id, None)
             logger.debug(f"Client {client_id} disconnected")
             
     async def send_personal_message(self, message: str, client_id: str):
@@ -88,10 +96,39 @@ class ConnectionManager:
         message = json.dumps(data, default=str)
         await self.send_personal_message(message, client_id)
         
+    async def _broadcast_changed(self, channel: str, data: dict,
+                                 client_ids: List[str], now: datetime):
+        """Broadcast a channel payload to the clients that have not seen it.
+
+        The change gate is keyed per (client, channel): clients polling at
+        a lower rate than the broadcast loop miss the cycle where a change
+        first goes out, so a single per-channel gate would leave them
+        permanently stale once the state stops changing. A client's entry
+        only updates when that client is actually served, and an idle
+        robot still costs one json.dumps per cycle instead of a send to
+        every client with identical content.
+        """
+        payload = json.dumps(data, default=str)
+        stale = [cid for cid in client_ids
+                 if channel in self.subscriptions.get(cid, set())
+                 and self._last_payload.get(cid, {}).get(channel) != payload]
+        if not stale:
+            return
+        for cid in stale:
+            self._last_payload.setdefault(cid, {})[channel] = payload
+        await self._broadcast_to_clients({
+            "type": channel,
+            "data": data,
+            "timestamp": now.isoformat()
+        }, channel, stale, now)
+
     async def _broadcast_to_clients(self, data: dict, subscription_type: str, client_ids: List[str], timestamp: datetime):
         """Internal method to broadcast to specific clients (rate limiting already checked)"""
         disconnected_clients = []
 
+        # Serialize once for all recipients, not once per client
+        message = json.dumps(data, default=str)
+
         for client_id in client_ids:
             # Check if client is subscribed to this data type
             if subscription_type not in self.subscriptions.get(client_id, set()):
@@ -101,7 +138,6 @@ class ConnectionManager:
             websocket = self.active_connections.get(client_id)
             if websocket:
                 try:
-                    message = json.dumps(data, default=str)
                     await websocket.send_text(message)
                 except Exception as e:
                     logger.error(f"Error broadcasting to {client_id}: {e}")
@@ -165,41 +201,29 @@ class ConnectionManager:
         if not clients_to_update:
             return
 
-        # Create separate messages for each data type
+        # Create separate messages for each data type. Each channel is
+        # change-gated per client: while the robot sits idle nothing is
+        # re-sent to clients that already saw the current state (the
+        # status channel below still goes out every cycle as a heartbeat).
         if status.pose:
-            await self._broadcast_to_clients({
-                "type": "pose",
-                "data": status.pose.dict(),
-                "timestamp": now.isoformat()
-            }, "pose", clients_to_update, now)
+            await self._broadcast_changed("pose", status.pose.dict(),
+                                          clients_to_update, now)
 
         if status.joints:
-            await self._broadcast_to_clients({
-                "type": "joints",
-                "data": status.joints.dict(),
-                "timestamp": now.isoformat()
-            }, "joints", clients_to_update, now)
+            await self._broadcast_changed("joints", status.joints.dict(),
+                                          clients_to_update, now)
 
         if status.speeds:
-            await self._broadcast_to_clients({
-                "type": "speeds",
-                "data": status.speeds.dict(),
-                "timestamp": now.isoformat()
-            }, "speeds", clients_to_update, now)
+            await self._broadcast_changed("speeds", status.speeds.dict(),
+                                          clients_to_update, now)
 
         if status.io:
-            await self._broadcast_to_clients({
-                "type": "io",
-                "data": status.io.dict(),
-                "timestamp": now.isoformat()
-            }, "io", clients_to_update, now)
+            await self._broadcast_changed("io", status.io.dict(),
+                                          clients_to_update, now)
 
         if status.gripper:
-            await self._broadcast_to_clients({
-                "type": "gripper",
-                "data": status.gripper.dict(),
-                "timestamp": now.isoformat()
-            }, "gripper", clients_to_update, now)
+            await self._broadcast_changed("gripper", status.gripper.dict(),
+                                          clients_to_update, now)
 
         # Always send overall status to status subscribers
         await self._broadcast_to_clients({
@@ -222,6 +246,9 @@ class ConnectionManager:
                 subscriptions = set(data["subscribe"])
                 valid_types = {'pose', 'joints', 'speeds', 'io', 'gripper', 'status', 'logs', 'system'}
                 self.subscriptions[client_id] = subscriptions & valid_types
+                # Drop the client's change-gate entries so newly subscribed
+                # channels get a full snapshot on the next broadcast cycle
+                self._last_payload.pop(client_id, None)
                 logger.debug(f"Client {client_id[:8]} subscribed to: {list(self.subscriptions[client_id])}")
 
                 # Send confirmation
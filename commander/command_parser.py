@@ -634,11 +634,10 @@ class CommandParser:
             if timing_type == 'DURATION':
                 duration = timing_value
             else:  # SPEED
-                # Calculate total path length
-                total_dist = 0
-                for i in range(1, len(waypoints)):
-                    dist = np.linalg.norm(np.array(waypoints[i][:3]) - np.array(waypoints[i-1][:3]))
-                    total_dist += dist
+                # Calculate total path length: one vectorized norm over
+                # all consecutive segment differences
+                xyz = np.array([wp[:3] for wp in waypoints])
+                total_dist = np.linalg.norm(np.diff(xyz, axis=0), axis=1).sum()
 
                 duration = self._calculate_duration_from_speed(total_dist, timing_value)
 
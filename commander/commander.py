@@ -749,12 +749,11 @@ def parse_smooth_motion_commands(parts):
             if timing_type == 'DURATION':
                 duration = timing_value
             else:  # SPEED
-                # Calculate total path length
-                total_dist = 0
-                for i in range(1, len(waypoints)):
-                    dist = np.linalg.norm(np.array(waypoints[i][:3]) - np.array(waypoints[i-1][:3]))
-                    total_dist += dist
-                
+                # Calculate total path length: one vectorized norm over
+                # all consecutive segment differences
+                xyz = np.array([wp[:3] for wp in waypoints])
+                total_dist = np.linalg.norm(np.diff(xyz, axis=0), axis=1).sum()
+
                 duration = calculate_duration_from_speed(total_dist, timing_value)
             
             logger.debug(f"  -> Parsed spline: {num_waypoints} points, frame={frame}, duration={duration:.2f}s")
@@ -902,12 +901,11 @@ def parse_smooth_motion_commands(parts):
                     segment_duration = float(seg_parts[3])
                     total_original_duration += segment_duration
                     
-                    # Estimate spline length
-                    estimated_length = 0
-                    for i in range(1, len(waypoints)):
-                        estimated_length += np.linalg.norm(
-                            np.array(waypoints[i][:3]) - np.array(waypoints[i-1][:3])
-                        )
+                    # Estimate spline length with one vectorized norm
+                    # over consecutive waypoint differences
+                    xyz = np.array([wp[:3] for wp in waypoints])
+                    estimated_length = np.linalg.norm(
+                        np.diff(xyz, axis=0), axis=1).sum()
                     total_estimated_length += estimated_length
                     
                     segment_definitions.append({
@@ -1324,7 +1322,7 @@ while timer.elapsed_time < 1100000:
 
             elif command_name == 'GET_POSE':
                 q_current = np.array([PAROL6_ROBOT.STEPS2RADS(p, i) for i, p in enumerate(Position_in)])
-                current_pose_matrix = PAROL6_ROBOT.robot.fkine(q_current).A
+                current_pose_matrix = PAROL6_ROBOT.fkine_fast(q_current)
                 pose_flat = current_pose_matrix.flatten()
                 pose_str = ",".join(map(str, pose_flat))
                 response_message = f"POSE|{pose_str}"
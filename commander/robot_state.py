@@ -13,6 +13,7 @@ import numpy as np
 from typing import List, Optional, Tuple
 from dataclasses import dataclass, field
 from spatialmath import SE3
+from scipy.spatial.transform import Rotation
 
 # Import robot model for unit conversions and kinematics
 from lib.kinematics import robot_model as PAROL6_ROBOT
@@ -22,6 +23,15 @@ from lib.kinematics import robot_model as PAROL6_ROBOT
 # Immutable State Snapshot
 # ============================================================================
 
+# FK results keyed on the raw step tuple, shared across state snapshots.
+# A new RobotState is created every feedback cycle, but while the robot
+# holds position the joint steps are identical, so the pose matrix can be
+# reused instead of recomputed - the FK only reruns when q actually
+# changes. Small FIFO cap; an idle robot needs exactly one entry.
+_POSE_CACHE: dict = {}
+_POSE_CACHE_MAX = 32
+
+
 @dataclass(frozen=True)
 class RobotState:
     """
@@ -92,6 +102,21 @@ class RobotState:
             object.__setattr__(self, 'position_deg', tuple(pos_deg))
         return list(self.position_deg)
 
+    def _tcp_pose_matrix(self) -> np.ndarray:
+        """Raw (4, 4) TCP pose matrix, cached per step tuple."""
+        if self.pose_matrix is None:
+            key = self.position_steps[:6]
+            pose_matrix = _POSE_CACHE.get(key)
+            if pose_matrix is None:
+                q = np.array(self.joints_position_rad)
+                pose_matrix = PAROL6_ROBOT.fkine_fast(q)
+                if len(_POSE_CACHE) >= _POSE_CACHE_MAX:
+                    _POSE_CACHE.pop(next(iter(_POSE_CACHE)))
+                _POSE_CACHE[key] = pose_matrix
+            object.__setattr__(self, 'pose_matrix', pose_matrix)
+
+        return self.pose_matrix
+
     @property
     def tcp_pose(self) -> SE3:
         """
@@ -100,22 +125,23 @@ class RobotState:
         Returns:
             SE3 transformation matrix representing TCP pose
         """
-        if self.pose_matrix is None:
-            q = np.array(self.joints_position_rad)
-            pose_matrix = PAROL6_ROBOT.robot.fkine(q).A
-            object.__setattr__(self, 'pose_matrix', pose_matrix)
-
-        return SE3(self.pose_matrix, check=False)
+        return SE3(self._tcp_pose_matrix(), check=False)
 
     @property
     def tcp_position_mm(self) -> np.ndarray:
         """Get TCP position in mm (x, y, z)"""
-        return self.tcp_pose.t * 1000  # Convert m to mm
+        # Read straight off the raw matrix; the SE3 wrapper and its .t
+        # property dispatch are pure overhead on this per-broadcast path
+        return self._tcp_pose_matrix()[:3, 3] * 1000  # Convert m to mm
 
     @property
     def tcp_orientation_deg(self) -> np.ndarray:
         """Get TCP orientation in degrees (rx, ry, rz) as XYZ Euler angles"""
-        return self.tcp_pose.rpy(unit='deg', order='xyz')
+        # scipy's compiled extractor; extrinsic 'zyx' is numerically
+        # identical to spatialmath's rpy(order='xyz') convention but avoids
+        # the spatialmath Python wrapper on this per-broadcast path
+        R = self._tcp_pose_matrix()[:3, :3]
+        return Rotation.from_matrix(R).as_euler('zyx', degrees=True)
 
     @property
     def tcp_pose_vector(self) -> List[float]:
@@ -16,7 +16,7 @@ from . import robot_model
 from . import trajectory_math
 
 # Also expose commonly used items directly
-from .ik_solver import solve_ik_with_adaptive_tol_subdivision, IKResult
+from .ik_solver import solve_ik_with_adaptive_tol_subdivision, solve_ik_batch, IKResult
 from .robot_model import robot, check_joint_limits
 
 __all__ = [
@@ -24,6 +24,7 @@ __all__ = [
     'robot_model',
     'trajectory_math',
     'solve_ik_with_adaptive_tol_subdivision',
+    'solve_ik_batch',
     'IKResult',
     'robot',
     'check_joint_limits',
@@ -0,0 +1,32 @@
+# Shared Denavit-Hartenberg constants for the PAROL6 robot.
+#
+# Single source of truth for the link lengths and DH parameter table so that
+# the robot model and any batched FK/IK helpers all read the same contiguous
+# array instead of re-declaring the constants per module.
+
+from math import pi
+import numpy as np
+
+# robot length values (metres)
+a1 = 110.50 / 1000
+a2 = 23.42 / 1000
+a3 = 180 / 1000
+a4 = 43.5 / 1000
+a5 = 176.35 / 1000
+a6 = 34.0 / 1000  # Fixed offset from J5/J6 intersection to J6 flange
+a7 = 0  # No offset - TCP at J5/J6 axis intersection
+
+alpha_DH = [-pi / 2, pi, pi / 2, -pi / 2, pi / 2, pi]
+
+# DH parameter table, one row per joint: [d, a, alpha, theta_offset].
+# Contiguous float64 layout so np.sin/np.cos can operate on column views
+# directly (DH_PARAMS[:, 0] is d, [:, 1] is a, [:, 2] is alpha, [:, 3] is
+# the fixed theta offset). Must match the RevoluteDH chain in robot_model.py.
+DH_PARAMS = np.array([
+    [a1,   a2,  alpha_DH[0], 0.0],
+    [0.0,  a3,  alpha_DH[1], 0.0],
+    [0.0, -a4,  alpha_DH[2], 0.0],
+    [-a5,  0.0, alpha_DH[3], 0.0],
+    [0.0,  0.0, alpha_DH[4], 0.0],
+    [-a6, -a7,  alpha_DH[5], pi / 2],  # +90° offset to align TCP with URDF
+], dtype=np.float64, order='C')
@@ -0,0 +1,169 @@
+"""
+JIT-Compiled Kinematics Kernels
+
+Pure-numeric helpers from the IK hot path (angle wrapping, unwrapping and
+the configuration-dependent reach model), compiled with Numba when it is
+installed so they run as native code with no interpreter dispatch.
+
+Numba is an optional dependency (it is heavy to install on the Raspberry Pi
+targets this project runs on), so the decorator degrades to a no-op and the
+kernels execute as plain NumPy expressions when it is missing. The outer
+wrappers in ik_solver.py coerce inputs to contiguous float64 before calling
+in, which keeps Numba down to a single specialization per kernel.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def normalize_angle_core(angle):
+    """Wrap angle(s) into [-pi, pi]; accepts a scalar or an ndarray."""
+    return (angle + np.pi) % (2 * np.pi) - np.pi
+
+
+@njit(cache=True, fastmath=True)
+def unwrap_angles_core(q_solution, q_current):
+    """Shift q_solution by 2*pi multiples so each joint is nearest q_current."""
+    return q_current + ((q_solution - q_current + np.pi) % (2 * np.pi) - np.pi)
+
+
+@njit(cache=True, fastmath=True)
+def max_reach_core(j5_angle):
+    """
+    Configuration-dependent max reach from the J5 angle (radians).
+
+    Constants must match calculate_configuration_dependent_max_reach in
+    ik_solver.py, which falls back to an equivalent scalar implementation
+    when Numba is unavailable.
+    """
+    j5 = (j5_angle + np.pi) % (2 * np.pi) - np.pi
+    half_pi = np.pi / 2
+    reduction_range = np.pi / 4
+    dist = min(abs(j5 - half_pi), abs(j5 + half_pi))
+    if dist <= reduction_range:
+        return 0.44 - 0.045 * (1.0 - dist / reduction_range)
+    return 0.44
+
+
+@njit(cache=True, fastmath=True)
+def lm_step_core(J, e, lam):
+    """
+    Damped least-squares step dq = (J'J + lam*D)^-1 J'e for a 6-DOF arm,
+    with Marquardt's D = diag(J'J) scaling (floored so flat directions
+    stay solvable).
+
+    Solves the 6x6 normal equations with a hand-rolled Cholesky
+    factorization and forward/back substitution; at this size the LAPACK
+    dispatch inside np.linalg.solve costs more than the arithmetic.
+    The damped matrix is symmetric positive definite for lam > 0, so
+    Cholesky never fails here.
+    """
+    H = J.T @ J
+    for i in range(6):
+        H[i, i] += lam * max(H[i, i], 1e-12)
+    g = J.T @ e
+    L = np.linalg.cholesky(H)
+    y = np.empty(6)
+    for i in range(6):
+        s = g[i]
+        for j in range(i):
+            s -= L[i, j] * y[j]
+        y[i] = s / L[i, i]
+    dq = np.empty(6)
+    for i in range(5, -1, -1):
+        s = y[i]
+        for j in range(i + 1, 6):
+            s -= L[j, i] * dq[j]
+        dq[i] = s / L[i, i]
+    return dq
+
+
+@njit(cache=True, fastmath=True)
+def rodrigues_core(kx, ky, kz, angle):
+    """
+    Rodrigues rotation matrix from scalar axis components and an angle
+    (radians). The nine entries are written out directly, so there is no
+    skew-matrix construction or K @ K product - just the trig and a
+    single (3, 3) allocation.
+    """
+    norm = np.sqrt(kx * kx + ky * ky + kz * kz)
+    kx, ky, kz = kx / norm, ky / norm, kz / norm
+    c = np.cos(angle)
+    s = np.sin(angle)
+    v = 1.0 - c
+    R = np.empty((3, 3))
+    R[0, 0] = c + kx * kx * v
+    R[0, 1] = kx * ky * v - kz * s
+    R[0, 2] = kx * kz * v + ky * s
+    R[1, 0] = ky * kx * v + kz * s
+    R[1, 1] = c + ky * ky * v
+    R[1, 2] = ky * kz * v - kx * s
+    R[2, 0] = kz * kx * v - ky * s
+    R[2, 1] = kz * ky * v + kx * s
+    R[2, 2] = c + kz * kz * v
+    return R
+
+
+@njit(cache=True, fastmath=True)
+def slerp_quat_core(q0, q1, t):
+    """
+    Closed-form quaternion slerp at a single scalar t.
+
+    Sign-flips q1 when the dot product is negative so interpolation takes
+    the short arc, and falls back to normalized lerp when the quaternions
+    are nearly parallel. Mirrors the vectorized _slerp_quat in
+    trajectory_math.py, which handles array-valued t.
+    """
+    d = q0[0] * q1[0] + q0[1] * q1[1] + q0[2] * q1[2] + q0[3] * q1[3]
+    sign = 1.0
+    if d < 0.0:
+        sign = -1.0
+        d = -d
+
+    out = np.empty(4)
+    if d > 0.9995:
+        for i in range(4):
+            out[i] = q0[i] + t * (sign * q1[i] - q0[i])
+        n = np.sqrt(out[0] * out[0] + out[1] * out[1]
+                    + out[2] * out[2] + out[3] * out[3])
+        for i in range(4):
+            out[i] /= n
+        return out
+
+    theta = np.arccos(min(d, 1.0))
+    s = np.sin(theta)
+    a = np.sin((1.0 - t) * theta) / s
+    b = sign * np.sin(t * theta) / s
+    for i in range(4):
+        out[i] = a * q0[i] + b * q1[i]
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # Warm-up compile at import so the first real IK call doesn't pay JIT
+    # latency; cache=True persists the compiled code across runs.
+    _q6 = np.zeros(6)
+    normalize_angle_core(0.0)
+    normalize_angle_core(_q6)
+    unwrap_angles_core(_q6, _q6)
+    max_reach_core(0.0)
+    lm_step_core(np.eye(6), _q6, 1e-4)
+    rodrigues_core(0.0, 0.0, 1.0, 0.0)
+    _qid = np.array([0.0, 0.0, 0.0, 1.0])
+    slerp_quat_core(_qid, _qid, 0.5)
+    del _q6, _qid
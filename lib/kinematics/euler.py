@@ -0,0 +1,63 @@
+"""
+Direct Euler-Angle Extraction
+=============================
+Closed-form atan2 extraction of xyz roll-pitch-yaw angles from a 3x3
+rotation matrix, matching spatialmath's tr2rpy(R, order='xyz') (the
+convention used for tool orientation throughout this project: returned
+angles (g, b, a) satisfy R = Rx(a) @ Ry(b) @ Rz(g)).
+
+spatialmath routes the same extraction through SO3 object construction
+and validity checking; for hot verification loops the plain formula on
+the raw array is pure ALU work.
+"""
+
+import math
+
+import numpy as np
+
+# cos(pitch) below this is treated as the gimbal-lock singularity
+_EPS = 1e-8
+
+
+def rpy_xyz(R):
+    """
+    Extract xyz-order RPY angles (radians) from a 3x3 rotation matrix.
+
+    Returns [g, b, a] such that R = Rx(a) @ Ry(b) @ Rz(g), the same
+    vector tr2rpy(R, order='xyz') produces. At the pitch = +/-90 deg
+    singularity only the sum/difference of g and a is determined; g is
+    reported as 0 there, again following spatialmath.
+    """
+    cy = math.hypot(R[0, 0], R[0, 1])
+    if cy > _EPS:
+        return np.array([
+            math.atan2(-R[0, 1], R[0, 0]),
+            math.atan2(R[0, 2], cy),
+            math.atan2(-R[1, 2], R[2, 2]),
+        ])
+    return np.array([
+        0.0,
+        math.atan2(R[0, 2], cy),
+        math.atan2(R[2, 1], R[1, 1]),
+    ])
+
+
+def rpy_xyz_batch(R):
+    """
+    Branchless rpy_xyz over a stack of rotation matrices.
+
+    Accepts any (..., 3, 3) array and returns (..., 3) angle vectors in
+    the same convention as the scalar function. The gimbal-lock case is
+    resolved with np.where instead of a branch, so the whole batch is
+    four atan2 ufunc passes regardless of content - suitable for
+    verifying every pose of a trajectory in one call.
+    """
+    R = np.asarray(R)
+    cy = np.hypot(R[..., 0, 0], R[..., 0, 1])
+    singular = cy <= _EPS
+    g = np.where(singular, 0.0, np.arctan2(-R[..., 0, 1], R[..., 0, 0]))
+    b = np.arctan2(R[..., 0, 2], cy)
+    a = np.where(singular,
+                 np.arctan2(R[..., 2, 1], R[..., 1, 1]),
+                 np.arctan2(-R[..., 1, 2], R[..., 2, 2]))
+    return np.stack([g, b, a], axis=-1)
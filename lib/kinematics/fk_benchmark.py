@@ -0,0 +1,100 @@
+"""
+Array-Driven FK Benchmark Harness
+=================================
+Batch front end for the FK pipeline: run_fk takes an (N, 6) stack of
+joint configurations and returns TCP positions, RPY angles and optional
+position errors in one call, and the CLI feeds it either a single
+configuration from the command line or an N-row CSV. No interactive
+prompts, so the batched kernel can be profiled at scale and wired into
+CI the same way ik_benchmark is.
+
+CSV layout: six joint columns in radians, optionally followed by three
+expected-XYZ columns in mm for error reporting.
+
+Usage:
+    python -m lib.kinematics.fk_benchmark --joints 0 -0.5 0.8 0 0.3 0
+    python -m lib.kinematics.fk_benchmark --csv poses.csv --repeats 10
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from .fk_numba import fk_trajectory, NUMBA_AVAILABLE
+
+
+def run_fk(joints_rad, expected_xyz_mm=None):
+    """
+    Evaluate FK over a batch of joint configurations.
+
+    Parameters
+    ----------
+    joints_rad : array_like
+        (N, 6) or (6,) joint angles in radians
+    expected_xyz_mm : array_like, optional
+        (N, 3) expected TCP positions in mm for error reporting
+
+    Returns
+    -------
+    tuple
+        (pos_mm, rpy_deg, err_mm) with shapes (N, 3), (N, 3) and (N,);
+        err_mm is None when no expected positions are given
+    """
+    Q = np.atleast_2d(np.asarray(joints_rad, dtype=np.float64))
+    pos_mm, rpy_rad, err_mm = fk_trajectory(Q, expected_xyz_mm)
+    return pos_mm, np.degrees(rpy_rad), err_mm
+
+
+def _load_csv(path):
+    """Split a CSV into joint columns and optional expected-XYZ columns."""
+    data = np.atleast_2d(np.loadtxt(path, delimiter=','))
+    if data.shape[1] not in (6, 9):
+        raise ValueError(
+            f"expected 6 or 9 columns in {path}, got {data.shape[1]}")
+    expected = data[:, 6:9] if data.shape[1] == 9 else None
+    return data[:, :6], expected
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Batched FK benchmark over joint-angle arrays")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument('--joints', type=float, nargs=6, metavar='RAD',
+                       help="single configuration, six joint angles in rad")
+    group.add_argument('--csv', help="CSV of configurations (6 joint "
+                       "columns in rad, optional 3 expected-XYZ in mm)")
+    parser.add_argument('--repeats', type=int, default=5,
+                        help="timing repeats, minimum reported (default 5)")
+    args = parser.parse_args(argv)
+
+    if args.csv:
+        Q, expected = _load_csv(args.csv)
+    else:
+        Q, expected = np.array([args.joints]), None
+
+    pos_mm, rpy_deg, err_mm = run_fk(Q, expected)  # warm + correctness pass
+
+    best = np.inf
+    for _ in range(max(1, args.repeats)):
+        t0 = time.perf_counter()
+        run_fk(Q, expected)
+        best = min(best, time.perf_counter() - t0)
+
+    n = len(Q)
+    print(f"fk backend: {'numba parallel' if NUMBA_AVAILABLE else 'numpy'}")
+    print(f"  {n} configurations in {best * 1000:.3f} ms "
+          f"({best / n * 1e6:.2f} us/config, min over {args.repeats})")
+    if n == 1:
+        print(f"  position mm: {np.round(pos_mm[0], 3).tolist()}")
+        print(f"  rpy deg:     {np.round(rpy_deg[0], 3).tolist()}")
+    else:
+        print(f"  position mm range: {np.round(pos_mm.min(axis=0), 1).tolist()}"
+              f" .. {np.round(pos_mm.max(axis=0), 1).tolist()}")
+    if err_mm is not None:
+        print(f"  position error mm: mean={err_mm.mean():.6f} "
+              f"max={err_mm.max():.6f}")
+
+
+if __name__ == "__main__":
+    main()
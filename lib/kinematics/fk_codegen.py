@@ -0,0 +1,125 @@
+"""
+Runtime-Generated Forward Kinematics
+====================================
+Generates a PAROL6-specialized fk6(q) at import time by partially
+evaluating the standard-DH chain against the fixed table in
+_dh_constants. Every alpha in the table is an exact multiple of pi/2, so
+cos(alpha)/sin(alpha) fold to 0 or +/-1 and most of the 4x4 multiply
+terms vanish at generation time; the emitted function is straight-line
+scalar arithmetic with six sin/cos pairs and no table lookups, SE3
+wrapping, or general trotx/transl calls.
+
+The generated source is ordinary Python (inspect fk6.__doc__ or
+_FK6_SOURCE to read it), so a DH-table change is picked up automatically
+on the next import.
+"""
+
+import math
+
+import numpy as np
+
+from ._dh_constants import DH_PARAMS
+
+
+def _const(value):
+    """Literal for an exactly-representable folded constant."""
+    return repr(float(value))
+
+
+def _term(*factors):
+    """
+    Product of string factors where None means zero and '1'/'-1' fold
+    away. Returns (sign, expr) with expr None when the product is zero.
+    """
+    sign = 1
+    parts = []
+    for f in factors:
+        if f is None or f in ('0', '0.0'):
+            return 1, None
+        if f in ('-1', '-1.0'):
+            sign = -sign
+        elif f not in ('1', '1.0'):
+            parts.append(f)
+    if not parts:
+        return sign, '1.0'
+    return sign, '*'.join(parts)
+
+
+def _dot(pairs):
+    """Sum of _term results as a source expression, or None if all zero."""
+    out = ''
+    for sign, expr in pairs:
+        if expr is None:
+            continue
+        if not out:
+            out = expr if sign > 0 else '-' + expr
+        else:
+            out += (' + ' if sign > 0 else ' - ') + expr
+    return out or None
+
+
+def _emit_fk6_source():
+    """Emit the specialized fk6 source from the DH table."""
+    lines = [
+        'def fk6(q):',
+        '    """Specialized PAROL6 FK, generated from DH_PARAMS."""',
+    ]
+    for i in range(6):
+        offset = DH_PARAMS[i, 3]
+        arg = f'q[{i}]' if offset == 0.0 else f'q[{i}] + {_const(offset)}'
+        lines.append(f'    s{i} = sin({arg}); c{i} = cos({arg})')
+
+    # Current transform as 3x4 string entries (bottom row is constant);
+    # None encodes a structurally zero entry.
+    rows = None
+    for i in range(6):
+        d, a, alpha = DH_PARAMS[i, 0], DH_PARAMS[i, 1], DH_PARAMS[i, 2]
+        ca = round(math.cos(alpha))
+        sa = round(math.sin(alpha))
+        si, ci = f's{i}', f'c{i}'
+        # Standard-DH link matrix with cos/sin(alpha) folded to 0/+/-1
+        A = [
+            [(1, ci), _term('-1', si, str(ca)), _term(str(sa), si),
+             _term(_const(a), ci) if a else (1, None)],
+            [(1, si), _term(str(ca), ci), _term('-1', str(sa), ci),
+             _term(_const(a), si) if a else (1, None)],
+            [(1, None), _term(str(sa)), _term(str(ca)),
+             (1, _const(d)) if d else (1, None)],
+        ]
+        A = [[_dot([entry]) for entry in row] for row in A]
+        if rows is None:
+            rows = A
+            continue
+        new = [[None] * 4 for _ in range(3)]
+        for r in range(3):
+            for c in range(4):
+                pairs = [_term(rows[r][k], A[k][c]) for k in range(3)]
+                expr = _dot(pairs)
+                if c == 3 and rows[r][3] is not None:
+                    expr = rows[r][3] if expr is None else expr + ' + ' + rows[r][3]
+                new[r][c] = expr
+        names = [[f'm{i}_{r}{c}' for c in range(4)] for r in range(3)]
+        for r in range(3):
+            for c in range(4):
+                if new[r][c] is not None:
+                    lines.append(f'    {names[r][c]} = {new[r][c]}')
+                    new[r][c] = names[r][c]
+        rows = new
+
+    # Emit explicit entry assignments rather than np.array on a nested
+    # list: identical when interpreted, and a form numba can compile
+    # directly (fk_unrolled.py njit-wraps this same source)
+    lines.append('    T = np.empty((4, 4))')
+    for r, row in enumerate(rows):
+        for c, e in enumerate(row):
+            lines.append(f'    T[{r}, {c}] = {e if e is not None else "0.0"}')
+    lines.append('    T[3, 0] = 0.0; T[3, 1] = 0.0; T[3, 2] = 0.0; T[3, 3] = 1.0')
+    lines.append('    return T')
+    return '\n'.join(lines) + '\n'
+
+
+_FK6_SOURCE = _emit_fk6_source()
+_ns = {'sin': math.sin, 'cos': math.cos, 'np': np}
+exec(compile(_FK6_SOURCE, '<fk_codegen>', 'exec'), _ns)
+fk6 = _ns['fk6']
+del _ns
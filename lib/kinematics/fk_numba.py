@@ -0,0 +1,131 @@
+"""
+Parallel Batched FK + Euler + Error Kernel
+==========================================
+Numba kernel that sweeps an (N, 6) stack of joint configurations and
+produces TCP positions (mm), xyz RPY angles and position errors against
+expected targets in one prange pass - each configuration is independent,
+so the loop parallelizes across all cores.
+
+Follows the optional-Numba convention from _kinematics_jit: with Numba
+missing, fk_trajectory falls back to the vectorized NumPy pipeline
+(batched transform cache + rpy_xyz_batch), which is the faster
+interpreted path anyway; the compiled kernel wins once native code and
+prange parallelism are available.
+"""
+
+import numpy as np
+
+from ._dh_constants import DH_PARAMS
+from .euler import rpy_xyz_batch
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+# DH table columns, hoisted once for the kernel signature
+_DH_D = np.ascontiguousarray(DH_PARAMS[:, 0])
+_DH_A = np.ascontiguousarray(DH_PARAMS[:, 1])
+_DH_CA = np.cos(DH_PARAMS[:, 2])
+_DH_SA = np.sin(DH_PARAMS[:, 2])
+_DH_OFF = np.ascontiguousarray(DH_PARAMS[:, 3])
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def fk_rpy_err_core(Q, d, a, ca, sa, off, expected_xyz):
+    """
+    FK, xyz RPY and position error for every row of Q, in parallel.
+
+    Positions and expected_xyz are in mm; angles in radians. The 4x4
+    chain and the Euler extraction are inlined so each prange iteration
+    is straight native arithmetic with no object allocation beyond the
+    per-row transform.
+    """
+    N = Q.shape[0]
+    pos = np.empty((N, 3))
+    rpy = np.empty((N, 3))
+    err = np.empty(N)
+    for n in prange(N):
+        T = np.eye(4)
+        for i in range(6):
+            th = Q[n, i] + off[i]
+            c, s = np.cos(th), np.sin(th)
+            A = np.empty((4, 4))
+            A[0, 0] = c
+            A[0, 1] = -s * ca[i]
+            A[0, 2] = s * sa[i]
+            A[0, 3] = a[i] * c
+            A[1, 0] = s
+            A[1, 1] = c * ca[i]
+            A[1, 2] = -c * sa[i]
+            A[1, 3] = a[i] * s
+            A[2, 0] = 0.0
+            A[2, 1] = sa[i]
+            A[2, 2] = ca[i]
+            A[2, 3] = d[i]
+            A[3, 0] = 0.0
+            A[3, 1] = 0.0
+            A[3, 2] = 0.0
+            A[3, 3] = 1.0
+            T = T @ A
+        for k in range(3):
+            pos[n, k] = T[k, 3] * 1000.0
+        # xyz-order RPY, same convention as euler.rpy_xyz
+        cy = np.sqrt(T[0, 0] * T[0, 0] + T[0, 1] * T[0, 1])
+        if cy > 1e-8:
+            rpy[n, 0] = np.arctan2(-T[0, 1], T[0, 0])
+            rpy[n, 1] = np.arctan2(T[0, 2], cy)
+            rpy[n, 2] = np.arctan2(-T[1, 2], T[2, 2])
+        else:
+            rpy[n, 0] = 0.0
+            rpy[n, 1] = np.arctan2(T[0, 2], cy)
+            rpy[n, 2] = np.arctan2(T[2, 1], T[1, 1])
+        dx = pos[n, 0] - expected_xyz[n, 0]
+        dy = pos[n, 1] - expected_xyz[n, 1]
+        dz = pos[n, 2] - expected_xyz[n, 2]
+        err[n] = np.sqrt(dx * dx + dy * dy + dz * dz)
+    return pos, rpy, err
+
+
+def fk_trajectory(Q, expected_xyz=None):
+    """
+    Evaluate FK over an (N, 6) joint stack.
+
+    Returns (pos_mm, rpy_rad, err_mm); err_mm is None when no
+    expected_xyz (N, 3) mm targets are given. Dispatches to the compiled
+    parallel kernel when Numba is available and to the vectorized NumPy
+    pipeline otherwise.
+    """
+    Q = np.ascontiguousarray(Q, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        exp = (np.zeros((Q.shape[0], 3)) if expected_xyz is None
+               else np.ascontiguousarray(expected_xyz, dtype=np.float64))
+        pos, rpy, err = fk_rpy_err_core(
+            Q, _DH_D, _DH_A, _DH_CA, _DH_SA, _DH_OFF, exp)
+        return pos, rpy, (None if expected_xyz is None else err)
+
+    from .ik_solver import _link_transform_cache, _fk_from_cache
+    T = _fk_from_cache(_link_transform_cache(Q))
+    pos = T[:, :3, 3] * 1000.0
+    rpy = rpy_xyz_batch(T[:, :3, :3])
+    err = None
+    if expected_xyz is not None:
+        err = np.linalg.norm(pos - np.asarray(expected_xyz), axis=1)
+    return pos, rpy, err
+
+
+if NUMBA_AVAILABLE:
+    # Warm-up compile at import (cache=True persists it across runs)
+    fk_rpy_err_core(np.zeros((1, 6)), _DH_D, _DH_A, _DH_CA, _DH_SA,
+                    _DH_OFF, np.zeros((1, 3)))
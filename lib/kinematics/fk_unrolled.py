@@ -0,0 +1,61 @@
+"""
+Compiled Unrolled Forward Kinematics
+====================================
+Numba-compiled variant of the generated straight-line FK in fk_codegen,
+with a minimal SE3-like result wrapper so call sites written against
+robot.fkine(q).t / .rpy('xyz') work unchanged.
+
+The kernel is the same constant-folded source fk_codegen emits (six
+sin/cos pairs, no interpreter dispatch over joint types, no zero-term
+multiplies); compiling it removes the remaining Python bytecode and
+float-boxing overhead. When Numba is not installed the plain generated
+function is used as-is, so this module always works.
+"""
+
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from .fk_codegen import _FK6_SOURCE
+from ._kinematics_jit import njit, NUMBA_AVAILABLE
+from .euler import rpy_xyz
+
+_ns = {'sin': math.sin, 'cos': math.cos, 'np': np}
+exec(compile(_FK6_SOURCE, '<fk_unrolled>', 'exec'), _ns)
+# cache=False: numba's on-disk cache needs a real source file, which a
+# runtime-generated function does not have. Compilation happens once per
+# process at import via the warm-up below.
+fkine_unrolled_core = njit(cache=False, fastmath=True)(_ns['fk6'])
+del _ns
+
+if NUMBA_AVAILABLE:
+    fkine_unrolled_core(np.zeros(6))
+
+
+class FKPose(namedtuple('FKPose', ['A'])):
+    """Bare (4, 4) pose with the SE3 accessors hot paths actually use."""
+
+    __slots__ = ()
+
+    @property
+    def t(self):
+        """Translation part, metres."""
+        return self.A[:3, 3]
+
+    @property
+    def R(self):
+        """Rotation part, (3, 3)."""
+        return self.A[:3, :3]
+
+    def rpy(self, order='xyz', unit='rad'):
+        """xyz-order RPY angles, matching SE3.rpy(order='xyz')."""
+        if order != 'xyz':
+            raise ValueError(f"only order='xyz' is supported, got {order!r}")
+        ang = rpy_xyz(self.A[:3, :3])
+        return np.degrees(ang) if unit == 'deg' else ang
+
+
+def fkine_unrolled(q):
+    """Drop-in fkine for the fixed PAROL6 chain: FKPose from 6 joint angles."""
+    return FKPose(fkine_unrolled_core(np.asarray(q, dtype=np.float64)))
@@ -0,0 +1,210 @@
+"""
+IK Benchmark Harness
+====================
+Standalone timing harness for the kinematics hot paths (batched FK and
+solve_ik_batch). The ad-hoc performance scripts this consolidates were
+never part of the tree, so target-pose construction lives here in
+vectorized form instead of per-pose SE3 composition: one
+scipy Rotation.from_euler call produces all rotation blocks and two array
+slices place them into a preallocated (N, 4, 4) stack.
+
+Run from the project root:
+
+    python -m lib.kinematics.ik_benchmark
+"""
+
+import time
+
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+from .ik_solver import solve_ik_batch, _fk_and_jacobian_batch
+
+
+def normalize_angle_deg(angle):
+    """
+    Wrap degree angle(s) into [-180, 180) with a single branchless modulo.
+
+    Works on scalars and ndarrays alike; the ufunc form vectorizes over
+    whole joint-error arrays instead of looping with while-subtract.
+    """
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+# Rotation matrices keyed on the exact (rx, ry, rz) degree tuple. Pose
+# grids reuse a handful of tool orientations, so repeated builds skip the
+# trig entirely.
+_R_CACHE = {}
+_R_CACHE_MAX = 512
+
+
+def rotation_for_rpy_deg(rpy_deg):
+    """Cached (3, 3) rotation for an xyz Euler triple in degrees."""
+    key = (float(rpy_deg[0]), float(rpy_deg[1]), float(rpy_deg[2]))
+    R = _R_CACHE.get(key)
+    if R is None:
+        R = Rotation.from_euler('xyz', key, degrees=True).as_matrix()
+        if len(_R_CACHE) >= _R_CACHE_MAX:
+            _R_CACHE.pop(next(iter(_R_CACHE)))
+        _R_CACHE[key] = R
+    return R
+
+
+def build_target_poses(num_tests=100,
+                       base_xyz_mm=(200.0, 0.0, 150.0),
+                       step_xyz_mm=(0.5, 0.3, 0.3),
+                       base_rpy_deg=(180.0, 0.0, 90.0),
+                       step_rpy_deg=(0.0, 0.2, 0.2)):
+    """
+    Build an (N, 4, 4) stack of target poses along a linear grid.
+
+    Positions are in mm and xyz Euler angles in degrees, matching the
+    waypoint convention used by trajectory_math. The whole stack is
+    assembled with a single Rotation.from_euler call and two slice
+    writes - no per-pose Python loop or SE3 allocation.
+    """
+    n = np.arange(num_tests, dtype=np.float64)[:, None]
+    xyz = np.asarray(base_xyz_mm) + n * np.asarray(step_xyz_mm)
+
+    Ts = np.tile(np.eye(4), (num_tests, 1, 1))
+    if not any(step_rpy_deg):
+        # Constant tool orientation: one cached rotation broadcast over
+        # the stack, no per-pose trig at all
+        Ts[:, :3, :3] = rotation_for_rpy_deg(base_rpy_deg)
+    else:
+        rpy = np.asarray(base_rpy_deg) + n * np.asarray(step_rpy_deg)
+        Ts[:, :3, :3] = Rotation.from_euler('xyz', rpy, degrees=True).as_matrix()
+    Ts[:, :3, 3] = xyz / 1000.0
+    return Ts
+
+
+def targets_from_random_q(num_tests=100, seed=0, span=1.2, walk_step=None):
+    """
+    Build guaranteed-reachable targets by running FK on random joint
+    configurations. Returns (Q_true, Ts) so callers can seed the solver
+    near (or away from) the known solutions.
+
+    With walk_step set, configurations form a random walk with per-joint
+    steps in [-walk_step, walk_step] - a stand-in for the closely spaced
+    waypoints a streamed trajectory produces.
+    """
+    rng = np.random.default_rng(seed)
+    if walk_step is None:
+        Q_true = rng.uniform(-span, span, (num_tests, 6))
+    else:
+        steps = rng.uniform(-walk_step, walk_step, (num_tests, 6))
+        steps[0] = rng.uniform(-span, span, 6)
+        Q_true = np.cumsum(steps, axis=0)
+    Ts = np.array(_fk_and_jacobian_batch(Q_true)[0])
+    return Q_true, Ts
+
+
+def benchmark_ik_performance(num_tests=100, seeds_per_target=4,
+                             seed_spread=0.3, warm_start=False):
+    """
+    Time solve_ik_batch over reachable targets and report the summary.
+
+    Each target is solved from seeds_per_target perturbed seeds, the same
+    multi-seed pattern the motion code uses for difficult poses. With
+    warm_start, targets follow a random walk and each solve is seeded
+    solely from the previous solution - the streaming pattern, where most
+    of the LM work disappears because the seed is already close.
+    """
+    rng = np.random.default_rng(1)
+    Q_true, Ts = targets_from_random_q(
+        num_tests, walk_step=0.02 if warm_start else None)
+
+    times = []
+    successes = 0
+    max_joint_dev = 0.0
+    last_q = None
+    solved_q = []
+    solved_idx = []
+    for k in range(num_tests):
+        if warm_start and last_q is not None:
+            seeds = last_q[None]
+        else:
+            seeds = Q_true[k] + rng.uniform(-seed_spread, seed_spread,
+                                            (seeds_per_target, 6))
+        t0 = time.perf_counter()
+        # solve_ik_batch builds its own DH chain, so no robot is needed
+        result = solve_ik_batch(None, Ts[k], seeds)
+        times.append(time.perf_counter() - t0)
+        successes += bool(result.success)
+        if result.success:
+            last_q = np.asarray(result.q, dtype=np.float64)
+            solved_q.append(last_q)
+            solved_idx.append(k)
+            # Compare against the generating configuration modulo full
+            # turns; the solver may land on a wrapped-equivalent branch
+            dev = normalize_angle_deg(np.degrees(result.q) -
+                                      np.degrees(Q_true[k]))
+            max_joint_dev = max(max_joint_dev, np.abs(dev).max())
+
+    # Verify all solutions with one batched FK pass instead of a
+    # per-solution fkine call - same per-link work, none of the per-call
+    # Python and SE3 overhead
+    max_pos_err_mm = 0.0
+    if solved_q:
+        T_solved = _fk_and_jacobian_batch(np.stack(solved_q))[0]
+        pos_err = T_solved[:, :3, 3] - Ts[solved_idx][:, :3, 3]
+        max_pos_err_mm = np.linalg.norm(pos_err, axis=1).max() * 1000.0
+
+    times_ms = np.array(times) * 1000.0
+    label = "warm-start walk" if warm_start else f"{seeds_per_target} seeds each"
+    print(f"solve_ik_batch: {num_tests} targets, {label}")
+    print(f"  success rate: {successes}/{num_tests}")
+    print(f"  per-solve ms: mean={times_ms.mean():.3f} "
+          f"median={np.median(times_ms):.3f} max={times_ms.max():.3f}")
+    print(f"  max joint deviation from generator: {max_joint_dev:.4f} deg")
+    print(f"  max FK position error: {max_pos_err_mm:.6f} mm")
+    return times_ms
+
+
+def time_solver_block(num_targets=50, repeats=5, seeds_per_target=4,
+                      seed_spread=0.3):
+    """
+    Block-timed per-solve cost: one clock read around the whole pass.
+
+    Per-iteration perf_counter pairs add ~100 ns plus scheduler jitter to
+    every sample, which is visible noise at sub-ms solve times. This runs
+    a correctness pass first (successes reported separately), then times
+    the whole target sweep as a block, repeats it, and reports the
+    minimum over repeats the way timeit.repeat does - the floor is the
+    least-perturbed measurement.
+    """
+    rng = np.random.default_rng(3)
+    Q_true, Ts = targets_from_random_q(num_targets, seed=3)
+    seed_sets = [Q_true[k] + rng.uniform(-seed_spread, seed_spread,
+                                         (seeds_per_target, 6))
+                 for k in range(num_targets)]
+
+    successes = sum(bool(solve_ik_batch(None, Ts[k], seed_sets[k]).success)
+                    for k in range(num_targets))
+
+    best = np.inf
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for k in range(num_targets):
+            solve_ik_batch(None, Ts[k], seed_sets[k])
+        best = min(best, (time.perf_counter() - t0) / num_targets)
+
+    per_solve_ms = best * 1000.0
+    print(f"block timing: {num_targets} targets x {repeats} repeats")
+    print(f"  success rate: {successes}/{num_targets}")
+    print(f"  per-solve ms (min over repeats): {per_solve_ms:.3f}")
+    return per_solve_ms
+
+
+if __name__ == "__main__":
+    print("PAROL6 IK benchmark")
+    print("=" * 40)
+
+    t0 = time.perf_counter()
+    Ts = build_target_poses(1000)
+    print(f"build_target_poses(1000): {(time.perf_counter() - t0) * 1000:.3f} ms")
+    print(f"  pose stack shape: {Ts.shape}")
+
+    benchmark_ik_performance()
+    benchmark_ik_performance(warm_start=True)
+    time_solver_block()
@@ -12,13 +12,20 @@ Author: Extracted from headless_commander.py
 Date: 2025-01-12
 """
 
+import math
+import threading
 import numpy as np
-from collections import namedtuple
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from scipy.spatial.transform import Rotation
 from spatialmath import SE3
 from spatialmath.base import trinterp
 from roboticstoolbox import DHRobot
 import logging
 
+from . import _kinematics_jit as _jit
+from ._dh_constants import DH_PARAMS
+
 # Get logger
 logger = logging.getLogger(__name__)
 
@@ -31,6 +38,31 @@ _prev_tolerance = None
 # Global performance monitor (set by commander.py)
 _performance_monitor = None
 
+# Memo for robot.manipulability keyed on the exact joint vector. Jogging and
+# pose-hold workloads re-solve from identical seeds, so hits are common and
+# each hit skips a Jacobian + det(J J^T) computation. Keyed on id(robot) so
+# a different robot model never reuses stale values.
+_manip_cache = {}
+_MANIP_CACHE_MAX = 128
+# Guards the evict+insert pair: solve_ik_multistart races seeds on a
+# thread pool, and two threads evicting the same oldest key would raise
+# KeyError out of a worker instead of returning its solve result.
+_manip_lock = threading.Lock()
+
+
+def _manipulability_cached(robot, q_array):
+    """Compute (or fetch memoized) manipulability for a joint configuration."""
+    key = (id(robot), q_array.tobytes())
+    manip = _manip_cache.get(key)
+    if manip is None:
+        manip = robot.manipulability(q_array)
+        with _manip_lock:
+            if len(_manip_cache) >= _MANIP_CACHE_MAX:
+                # Drop the oldest entry (dicts preserve insertion order)
+                _manip_cache.pop(next(iter(_manip_cache)))
+            _manip_cache[key] = manip
+    return manip
+
 def set_performance_monitor(monitor):
     """Set the global performance monitor for IK timing"""
     global _performance_monitor
@@ -41,21 +73,24 @@ def normalize_angle(angle):
     """
     Normalize angle to [-pi, pi] range to handle angle wrapping.
 
+    Constant-time branchless form: the old while-loop iterated once per
+    2*pi of magnitude and ran on the IK hot path. Accepts scalars or
+    NumPy arrays (the array form normalizes a whole q vector at once).
+
     Parameters
     ----------
-    angle : float
-        Angle in radians
+    angle : float or ndarray
+        Angle(s) in radians
 
     Returns
     -------
-    float
-        Normalized angle in range [-pi, pi]
+    float or ndarray
+        Normalized angle(s) in range [-pi, pi]
     """
-    while angle > np.pi:
-        angle -= 2 * np.pi
-    while angle < -np.pi:
-        angle += 2 * np.pi
-    return angle
+    if isinstance(angle, float):
+        # C-level single call, avoids NumPy scalar boxing on the hot path
+        return math.remainder(angle, 2 * math.pi)
+    return _jit.normalize_angle_core(np.asarray(angle, dtype=np.float64))
 
 
 def unwrap_angles(q_solution, q_current):
@@ -77,24 +112,32 @@ def unwrap_angles(q_solution, q_current):
     ndarray
         Unwrapped solution angles
     """
-    q_unwrapped = q_solution.copy()
+    q_solution = np.ascontiguousarray(q_solution, dtype=np.float64)
+    q_current = np.ascontiguousarray(q_current, dtype=np.float64)
 
-    for i in range(len(q_solution)):
-        # Calculate the difference
-        diff = q_solution[i] - q_current[i]
+    # Single pass over the joint vector: wrap the per-joint difference into
+    # [-pi, pi] and re-apply it to the current configuration. Runs as
+    # compiled code when Numba is installed (see _kinematics_jit).
+    return _jit.unwrap_angles_core(q_solution, q_current)
 
-        # If the difference is more than pi, we need to unwrap
-        if diff > np.pi:
-            # Solution is too far in positive direction, subtract 2*pi
-            q_unwrapped[i] = q_solution[i] - 2 * np.pi
-        elif diff < -np.pi:
-            # Solution is too far in negative direction, add 2*pi
-            q_unwrapped[i] = q_solution[i] + 2 * np.pi
 
-    return q_unwrapped
+# Manipulability below this is treated as "at a singularity"
+_SINGULARITY_THRESHOLD = 0.001
 
 
-def calculate_adaptive_tolerance(robot, q, strict_tol=1e-10, loose_tol=1e-7):
+def _norm3(v):
+    """
+    Euclidean norm of a 3-vector via scalar math.
+
+    np.linalg.norm spends ~10x the arithmetic cost in dtype/axis dispatch
+    at this size, which matters in the per-segment checks of the
+    subdivision loop.
+    """
+    return math.sqrt(v[0] * v[0] + v[1] * v[1] + v[2] * v[2])
+
+
+def calculate_adaptive_tolerance(robot, q, strict_tol=1e-10, loose_tol=1e-7,
+                                 return_manipulability=False):
     """
     Calculate adaptive tolerance based on proximity to singularities.
 
@@ -111,11 +154,14 @@ def calculate_adaptive_tolerance(robot, q, strict_tol=1e-10, loose_tol=1e-7):
         Strict tolerance away from singularities (default: 1e-10)
     loose_tol : float, optional
         Loose tolerance near singularities (default: 1e-7)
+    return_manipulability : bool, optional
+        If True, return (tolerance, manipulability) so callers can reuse
+        the manipulability without recomputing it (default: False)
 
     Returns
     -------
-    float
-        Adaptive tolerance value
+    float or tuple
+        Adaptive tolerance value, or (tolerance, manipulability)
     """
     global _prev_tolerance
 
@@ -124,11 +170,11 @@ def calculate_adaptive_tolerance(robot, q, strict_tol=1e-10, loose_tol=1e-7):
     # Calculate manipulability measure (closer to 0 = closer to singularity)
     if _performance_monitor:
         _performance_monitor.start_phase('ik_manipulability')
-    manip = robot.manipulability(q_array)
+    manip = _manipulability_cached(robot, q_array)
     if _performance_monitor:
         _performance_monitor.end_phase('ik_manipulability')
 
-    singularity_threshold = 0.001
+    singularity_threshold = _SINGULARITY_THRESHOLD
 
     # Normalize singularity proximity to [0, 1] range
     sing_normalized = np.clip(manip / singularity_threshold, 0.0, 1.0)
@@ -136,16 +182,29 @@ def calculate_adaptive_tolerance(robot, q, strict_tol=1e-10, loose_tol=1e-7):
     # Interpolate between loose and strict tolerance
     adaptive_tol = loose_tol + (strict_tol - loose_tol) * sing_normalized
 
-    # Log tolerance changes (only log significant changes to avoid spam)
+    # Log tolerance changes (only log significant changes to avoid spam);
+    # gate on isEnabledFor so the category ternary and float formatting
+    # never run when DEBUG is off - this sits on the per-IK-call path
     if _prev_tolerance is None or abs(adaptive_tol - _prev_tolerance) / _prev_tolerance > 0.5:
-        tol_category = "LOOSE" if adaptive_tol > 1e-7 else "MODERATE" if adaptive_tol > 5e-10 else "STRICT"
-        logger.debug(f"[IKSolver] Adaptive tolerance: {adaptive_tol:.2e} ({tol_category}) - "
-                    f"Manipulability: {manip:.8f} (threshold: {singularity_threshold})")
+        if logger.isEnabledFor(logging.DEBUG):
+            tol_category = "LOOSE" if adaptive_tol > 1e-7 else "MODERATE" if adaptive_tol > 5e-10 else "STRICT"
+            logger.debug("[IKSolver] Adaptive tolerance: %.2e (%s) - Manipulability: %.8f (threshold: %s)",
+                         adaptive_tol, tol_category, manip, singularity_threshold)
         _prev_tolerance = adaptive_tol
 
+    if return_manipulability:
+        return adaptive_tol, manip
     return adaptive_tol
 
 
+# Reach model constants (from experimentation); plain Python floats so the
+# function below stays in CPython scalar arithmetic on the IK hot path
+_BASE_MAX_REACH = 0.44
+_REACH_REDUCTION = 0.045
+_HALF_PI = math.pi / 2
+_REDUCTION_RANGE = math.pi / 4  # 45 degrees
+
+
 def calculate_configuration_dependent_max_reach(q_seed):
     """
     Calculate maximum reach based on joint configuration, particularly joint 5.
@@ -153,6 +212,9 @@ def calculate_configuration_dependent_max_reach(q_seed):
     When joint 5 is at ±90 degrees, the effective reach is reduced by approximately
     0.045m due to the robot's kinematic structure.
 
+    Uses math-module scalar ops throughout - this runs once per subdivision
+    segment and NumPy scalar boxing is measurable at that rate.
+
     Parameters
     ----------
     q_seed : array_like
@@ -163,29 +225,25 @@ def calculate_configuration_dependent_max_reach(q_seed):
     float
         Configuration-dependent maximum reach threshold in meters
     """
-    base_max_reach = 0.44  # Base maximum reach from experimentation
-
     # Get J5 angle
-    j5_angle = q_seed[4] if len(q_seed) > 4 else 0.0
+    j5_angle = float(q_seed[4]) if len(q_seed) > 4 else 0.0
+
+    if _jit.NUMBA_AVAILABLE:
+        return _jit.max_reach_core(j5_angle)
+
     j5_normalized = normalize_angle(j5_angle)
 
-    # Calculate distance from ±90 degrees
-    angle_90_deg = np.pi / 2
-    angle_neg_90_deg = -np.pi / 2
-    dist_from_90 = abs(j5_normalized - angle_90_deg)
-    dist_from_neg_90 = abs(j5_normalized - angle_neg_90_deg)
-    dist_from_90_deg = min(dist_from_90, dist_from_neg_90)
+    # Distance from whichever of ±90 degrees is closer
+    dist_from_90_deg = min(math.fabs(j5_normalized - _HALF_PI),
+                           math.fabs(j5_normalized + _HALF_PI))
 
     # Apply reach reduction within 45-degree range of ±90°
-    reduction_range = np.pi / 4  # 45 degrees
-    if dist_from_90_deg <= reduction_range:
+    if dist_from_90_deg <= _REDUCTION_RANGE:
         # Calculate reduction factor based on proximity to 90°
-        proximity_factor = 1.0 - (dist_from_90_deg / reduction_range)
-        reach_reduction = 0.045 * proximity_factor
-        effective_max_reach = base_max_reach - reach_reduction
-        return effective_max_reach
+        proximity_factor = 1.0 - (dist_from_90_deg / _REDUCTION_RANGE)
+        return _BASE_MAX_REACH - _REACH_REDUCTION * proximity_factor
     else:
-        return base_max_reach
+        return _BASE_MAX_REACH
 
 
 def solve_ik_with_adaptive_tol_subdivision(
@@ -205,7 +263,7 @@ def solve_ik_with_adaptive_tol_subdivision(
     - Near singularities: looser tolerance for easier convergence
     - Away from singularities: stricter tolerance for precise solutions
 
-    If necessary, recursively subdivides the motion until ikine_LMS converges
+    If necessary, iteratively subdivides the motion until ik_LM converges
     on every segment. Finally checks that solution respects joint limits.
 
     From experimentation, jogging with lower tolerances often produces q_paths
@@ -241,22 +299,67 @@ def solve_ik_with_adaptive_tol_subdivision(
         - tolerance_used: Tolerance value used
         - violations: Joint limit violations (if any)
     """
+    # Work with the raw (4, 4) matrix internally; robot.fkine's SE3 wrapper
+    # adds validation and property-dispatch overhead on every solve, and
+    # the batched DH chain below gives the same pose to machine precision.
     if current_pose is None:
-        current_pose = robot.fkine(current_q)
+        current_T = _fk_from_cache(_link_transform_cache(
+            np.asarray(current_q, dtype=np.float64)[None]))[0]
+    else:
+        current_T = current_pose.A
 
-    # ── Inner recursive solver ───────────────────────────────────────────
-    def _solve(Ta: SE3, Tb: SE3, q_seed, depth, tol):
-        """
-        Recursive IK solver with subdivision.
+    # ── Kick off with adaptive tolerance ─────────────────────────────────
+    if jogging:
+        adaptive_tol = 1e-10  # Strict tolerance for jogging
+        sing_normalized = None
+    else:
+        adaptive_tol, manip = calculate_adaptive_tolerance(
+            robot, current_q, return_manipulability=True)
+        sing_normalized = min(manip / _SINGULARITY_THRESHOLD, 1.0)
+
+    # Tie LM damping and iteration budget to singularity proximity: near a
+    # singularity J is ill-conditioned and a larger Levenberg damping term
+    # conditions (J^T J + k I) far better per step, while well-conditioned
+    # configurations converge in well under 30 iterations anyway.
+    if sing_normalized is None:
+        adaptive_damping = 0.0000001
+        effective_ilimit = ilimit
+    else:
+        adaptive_damping = max(1e-7, 1e-4 * (1.0 - sing_normalized))
+        effective_ilimit = min(ilimit, 30) if sing_normalized >= 1.0 else ilimit
+
+    # Jogging dead-band short-circuit: jog ticks frequently request a pose
+    # within noise of where the robot already is - skip the whole solver
+    # call and report the current configuration as the solution.
+    if jogging:
+        dead_band = math.sqrt(adaptive_tol)
+        if (_norm3(target_pose.t - current_T[:3, 3]) < dead_band
+                and np.linalg.norm(target_pose.R - current_T[:3, :3]) < dead_band):
+            return IKResult(True, np.asarray(current_q, dtype=np.float64),
+                            0, 0.0, adaptive_tol, [])
+
+    # ── Iterative subdivision over a work deque ──────────────────────────
+    # Segments are (Ta, Tb, q_seed, depth) with Ta/Tb as raw 4x4 arrays —
+    # SE3 wrapping/validation per level is pure overhead here, so poses are
+    # only wrapped (check=False) at the ik_LM boundary. A None seed means
+    # "use the end of the previously solved segment" (the left half always
+    # completes before its right half is popped, so ordering matches the
+    # old recursive formulation without per-level frames or list
+    # concatenation).
+    segments = deque([(current_T, target_pose.A, current_q, 0)])
+    path = []
+    ok = True
+    its = 0
+    resid = 0
+
+    while segments:
+        Ta, Tb, q_seed, depth = segments.popleft()
+        if q_seed is None:
+            q_seed = path[-1] if path else current_q
 
-        Returns
-        -------
-        tuple
-            (path_list, success_flag, iterations, residual)
-        """
         # Calculate current and target reach
-        current_reach = np.linalg.norm(Ta.t)
-        target_reach = np.linalg.norm(Tb.t)
+        current_reach = _norm3(Ta[:3, 3])
+        target_reach = _norm3(Tb[:3, 3])
 
         # Check if this is an inward movement (recovery)
         is_recovery = target_reach < current_reach
@@ -272,57 +375,56 @@ def solve_ik_with_adaptive_tol_subdivision(
             # Check if we're near configuration-dependent max reach
             if target_reach > max_reach_threshold:
                 logger.error(f"[IKSolver] Target reach limit exceeded: {target_reach:.3f}m > {max_reach_threshold:.3f}m")
-                return [], False, depth, 0
+                ok = False
+                break
             else:
-                damping = 0.0000001  # Normal low damping
+                damping = adaptive_damping  # Manipulability-scaled damping
 
         # Attempt IK solution (using C++ ik_LM for performance)
         if _performance_monitor:
             _performance_monitor.start_phase('ik_solve')
         # ik_LM returns: (q, success_flag, iterations, searches, residual)
         q_result, success_flag, iterations, searches, residual = robot.ik_LM(
-            Tb, q0=q_seed, ilimit=ilimit, tol=tol, k=damping, method='sugihara'
+            SE3(Tb, check=False), q0=q_seed, ilimit=effective_ilimit,
+            tol=adaptive_tol, k=damping, method='sugihara'
         )
         if _performance_monitor:
             _performance_monitor.end_phase('ik_solve')
 
+        its += iterations
+        resid = residual
+
         if success_flag:
-            q_good = unwrap_angles(q_result, q_seed)  # Unwrap vs previous configuration
-            return [q_good], True, iterations, residual
+            path.append(unwrap_angles(q_result, q_seed))  # Unwrap vs previous configuration
+            continue
 
         # If failed and max depth reached, give up
         if depth >= max_depth:
-            return [], False, iterations, residual
-
-        # Split the segment and recurse
-        Tc = SE3(trinterp(Ta.A, Tb.A, 0.5))  # Mid-pose (screw interpolation)
-
-        # Solve first half
-        left_path, ok_L, it_L, r_L = _solve(Ta, Tc, q_seed, depth + 1, tol)
-        if not ok_L:
-            return [], False, it_L, r_L
-
-        # Solve second half using end of first half as seed
-        q_mid = left_path[-1]
-        right_path, ok_R, it_R, r_R = _solve(Tc, Tb, q_mid, depth + 1, tol)
-
-        return (
-            left_path + right_path,
-            ok_R,
-            it_L + it_R,
-            r_R
-        )
-
-    # ── Kick off with adaptive tolerance ─────────────────────────────────
-    if jogging:
-        adaptive_tol = 1e-10  # Strict tolerance for jogging
-    else:
-        adaptive_tol = calculate_adaptive_tolerance(robot, current_q)
-
-    # Solve IK with subdivision
-    path, ok, its, resid = _solve(current_pose, target_pose, current_q, 0, adaptive_tol)
-
-    # Check if solution respects joint limits
+            ok = False
+            break
+
+        # Warm-start the left half from the failed attempt's partial result:
+        # ik_LM returns its best iterate even on failure, and that gradient
+        # information is usually closer to the mid-pose than the cold seed.
+        # Only reuse it when it stayed in the seed's neighbourhood (a wild
+        # divergence would drag the subdivision to the wrong branch).
+        q_left_seed = q_seed
+        if q_result is not None:
+            q_result = np.asarray(q_result, dtype=np.float64)
+            if np.all(np.isfinite(q_result)) and np.linalg.norm(q_result - q_seed) < np.pi:
+                q_left_seed = q_result
+
+        # Split the segment and queue both halves (left first; the right
+        # half seeds from the left half's solution via the None marker)
+        Tc = trinterp(Ta, Tb, 0.5)  # Mid-pose (screw interpolation)
+        segments.extendleft([
+            (Tc, Tb, None, depth + 1),
+            (Ta, Tc, q_left_seed, depth + 1),
+        ])
+
+    # Check if solution respects joint limits. The check runs exactly once
+    # on the converged configuration - never inside the LM iterations, so
+    # valid solutions pay nothing for it.
     target_q = path[-1] if len(path) != 0 else None
 
     if joint_limits_checker is not None:
@@ -332,12 +434,439 @@ def solve_ik_with_adaptive_tol_subdivision(
         solution_valid = ok
         violations = []
 
+    # Converged onto an out-of-range branch: retry once from a seed pulled
+    # halfway toward the home pose, which biases ik_LM to the in-range
+    # solution of the same target. Skipped while jogging (small deltas
+    # cannot branch-hop, and the jog tick budget is tight).
+    if ok and not solution_valid and not jogging:
+        q_retry, success_flag, iterations, _, residual = robot.ik_LM(
+            target_pose, q0=0.5 * np.asarray(current_q, dtype=np.float64),
+            ilimit=effective_ilimit, tol=adaptive_tol, k=adaptive_damping,
+            method='sugihara'
+        )
+        its += iterations
+        if success_flag:
+            q_retry = unwrap_angles(q_retry, current_q)
+            retry_valid, retry_violations = joint_limits_checker(
+                current_q, q_retry)
+            if retry_valid:
+                return IKResult(True, q_retry, its, residual,
+                                adaptive_tol, retry_violations)
+
     if ok and solution_valid:
         return IKResult(True, path[-1], its, resid, adaptive_tol, violations)
     else:
         return IKResult(False, None, its, resid, adaptive_tol, violations)
 
 
+def solve_ik_multistart(robot, target_pose, current_q, num_starts=8,
+                        spread=0.5, max_workers=4, tol=1e-10, ilimit=100):
+    """
+    Parallel multi-start IK: race several seeds through ik_LM in threads.
+
+    The C++ ik_LM binding releases the GIL while iterating, so a small
+    thread pool genuinely overlaps the starts, and the first success wins
+    instead of the worst-case seed dominating latency. Intended for
+    difficult isolated targets (program start, large reorientations);
+    streaming paths are better served by the warm-seeded solvers.
+
+    Parameters
+    ----------
+    robot : DHRobot
+        Robot model
+    target_pose : SE3 or ndarray
+        Target pose (SE3 or raw 4x4)
+    current_q : array_like
+        Preferred configuration; used as the first seed and as the
+        unwrap reference for the winning solution
+    num_starts : int, optional
+        Total seeds, the preferred one plus random perturbations (default: 8)
+    spread : float, optional
+        Per-joint perturbation half-range in radians (default: 0.5)
+    max_workers : int, optional
+        Thread-pool size (default: 4)
+    tol : float, optional
+        ik_LM convergence tolerance (default: 1e-10)
+    ilimit : int, optional
+        ik_LM iteration limit per start (default: 100)
+
+    Returns
+    -------
+    IKResult
+        First successful start (violations is always empty; apply a
+        joint-limit check on the result if needed)
+    """
+    q0 = np.asarray(current_q, dtype=np.float64)
+    Tep = target_pose if isinstance(target_pose, SE3) else SE3(
+        np.asarray(target_pose, dtype=np.float64), check=False)
+
+    rng = np.random.default_rng()
+    seeds = [q0] + [q0 + rng.uniform(-spread, spread, 6)
+                    for _ in range(num_starts - 1)]
+
+    def _solve(seed):
+        return robot.ik_LM(Tep, q0=seed, ilimit=ilimit, tol=tol,
+                           method='sugihara')
+
+    total_its = 0
+    best_residual = np.inf
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = {pool.submit(_solve, seed) for seed in seeds}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                q_result, success_flag, iterations, _, residual = future.result()
+                total_its += iterations
+                best_residual = min(best_residual, residual)
+                if success_flag:
+                    for other in pending:
+                        other.cancel()
+                    return IKResult(True, unwrap_angles(q_result, q0),
+                                    total_its, residual, tol, [])
+
+    return IKResult(False, None, total_its, best_residual, tol, [])
+
+
+# DH table columns hoisted to module level with the constant trig folded,
+# so _dh_link_matrices is pure broadcasting over (N, 6) with no per-link
+# Python loop
+_DH_D = DH_PARAMS[:, 0].copy()
+_DH_A = DH_PARAMS[:, 1].copy()
+_DH_CA = np.cos(DH_PARAMS[:, 2])
+_DH_SA = np.sin(DH_PARAMS[:, 2])
+_DH_OFFSET = DH_PARAMS[:, 3].copy()
+
+# numexpr fuses the cos/sin evaluation over the whole (N, 6) block and
+# threads it internally, which pays off once N is large enough to beat
+# its dispatch overhead. Optional, like numba in _kinematics_jit.
+try:
+    import numexpr as _ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+_NUMEXPR_MIN_N = 64
+
+# Per-thread scratch for the theta/cos/sin temporaries so repeated FK
+# calls do not allocate three (N, 6) arrays each; thread-local because
+# solve_ik_multistart runs solves concurrently.
+_trig_scratch = threading.local()
+
+
+def _trig_buffers(N):
+    """Per-thread (theta, cos, sin) scratch rows, grown as needed."""
+    bufs = getattr(_trig_scratch, 'bufs', None)
+    if bufs is None or bufs[0].shape[0] < N:
+        bufs = (np.empty((N, 6)), np.empty((N, 6)), np.empty((N, 6)))
+        _trig_scratch.bufs = bufs
+    return bufs[0][:N], bufs[1][:N], bufs[2][:N]
+
+
+def _dh_link_matrices(Q, out=None):
+    """
+    Standard-DH link transforms for a batch of joint configurations.
+
+    Parameters
+    ----------
+    Q : ndarray
+        (N, 6) joint configurations in radians
+    out : ndarray, optional
+        (N, 6, 4, 4) buffer to fill and return; must have been produced
+        by a previous call for the same N (the structurally zero entries
+        are only written at allocation time)
+
+    Returns
+    -------
+    ndarray
+        (N, 6, 4, 4) per-link A matrices built from the shared DH table
+    """
+    N = Q.shape[0]
+    theta, ct, st = _trig_buffers(N)
+    np.add(Q, _DH_OFFSET, out=theta)
+    if NUMEXPR_AVAILABLE and N >= _NUMEXPR_MIN_N:
+        _ne.evaluate('cos(theta)', local_dict={'theta': theta}, out=ct)
+        _ne.evaluate('sin(theta)', local_dict={'theta': theta}, out=st)
+    else:
+        np.cos(theta, out=ct)
+        np.sin(theta, out=st)
+
+    A = np.zeros((N, 6, 4, 4)) if out is None else out
+    A[:, :, 0, 0] = ct
+    A[:, :, 0, 1] = -st * _DH_CA
+    A[:, :, 0, 2] = st * _DH_SA
+    A[:, :, 0, 3] = _DH_A * ct
+    A[:, :, 1, 0] = st
+    A[:, :, 1, 1] = ct * _DH_CA
+    A[:, :, 1, 2] = -ct * _DH_SA
+    A[:, :, 1, 3] = _DH_A * st
+    A[:, :, 2, 1] = _DH_SA
+    A[:, :, 2, 2] = _DH_CA
+    A[:, :, 2, 3] = _DH_D
+    A[:, :, 3, 3] = 1.0
+    return A
+
+
+def _link_transform_cache(Q, out=None):
+    """
+    Per-link transforms and their cumulative products for a batch.
+
+    The A matrices (with their trig evaluations) are the shared input to
+    both FK and the geometric Jacobian, so they are computed exactly once
+    per configuration here and both consumers read from the result.
+
+    Parameters
+    ----------
+    Q : ndarray
+        (N, 6) joint configurations in radians
+    out : tuple, optional
+        (A, T_cum) buffers from a previous same-N call, reused in place
+        so iteration loops avoid reallocating them
+
+    Returns
+    -------
+    tuple
+        (A, T_cum) where A is (N, 6, 4, 4) per-link transforms and T_cum
+        is (N, 7, 4, 4) with T_cum[:, 0] = I and
+        T_cum[:, i + 1] = A_0 @ ... @ A_i
+    """
+    N = Q.shape[0]
+    if out is None:
+        A = _dh_link_matrices(Q)
+        T_cum = np.empty((N, 7, 4, 4))
+        T_cum[:, 0] = np.eye(4)
+    else:
+        A, T_cum = out
+        _dh_link_matrices(Q, out=A)
+    for i in range(6):
+        np.matmul(T_cum[:, i], A[:, i], out=T_cum[:, i + 1])
+    return A, T_cum
+
+
+def _fk_from_cache(cache):
+    """End-effector transforms, (N, 4, 4), from a _link_transform_cache."""
+    return cache[1][:, -1]
+
+
+def _jacobian_from_cache(cache, out=None):
+    """
+    World-frame geometric Jacobians, (N, 6, 6), from a _link_transform_cache.
+
+    Joint i rotates about the z axis of frame i-1, so column i is built
+    from z_i = T_cum[i][:3, 2] and p_i = T_cum[i][:3, 3] (linear part on
+    top, angular below). Pass a (N, 6, 6) buffer as out to fill in place.
+    """
+    T_cum = cache[1]
+    z = T_cum[:, :6, :3, 2]
+    p = T_cum[:, :6, :3, 3]
+    pe = T_cum[:, -1, :3, 3]
+    Jv = np.cross(z, pe[:, None, :] - p)
+    if out is None:
+        return np.concatenate([Jv, z], axis=2).transpose(0, 2, 1)
+    out[:, :3, :] = Jv.transpose(0, 2, 1)
+    out[:, 3:, :] = z.transpose(0, 2, 1)
+    return out
+
+
+def _fk_and_jacobian_batch(Q):
+    """
+    Forward kinematics and world-frame geometric Jacobian for a batch.
+
+    Parameters
+    ----------
+    Q : ndarray
+        (N, 6) joint configurations in radians
+
+    Returns
+    -------
+    tuple
+        (T, J) where T is (N, 4, 4) end-effector transforms and J is
+        (N, 6, 6) geometric Jacobians (linear on top, angular below)
+    """
+    cache = _link_transform_cache(Q)
+    return _fk_from_cache(cache), _jacobian_from_cache(cache)
+
+
+def _pose_error_batch(T, Rt, pt, out=None):
+    """
+    Pose error vectors and squared norms against a fixed target.
+
+    The orientation part is the quaternion-log error: with the error
+    rotation R_t R_c' expressed as a quaternion (w, v), the residual is
+    omega = (2 atan2(|v|, |w|) / |v|) * v * sign(w), i.e. the exact
+    rotation vector. Unlike an RPY difference it has no gimbal-lock
+    singularity (PAROL6 tool poses sit near pitch 90 deg routinely), and
+    unlike the cross-product form it does not flatten out for errors
+    approaching 180 deg, which keeps LM steps full-length far from the
+    target.
+
+    Parameters
+    ----------
+    T : ndarray
+        (N, 4, 4) current end-effector transforms
+    Rt : ndarray
+        (3, 3) target rotation
+    pt : ndarray
+        (3,) target position
+    out : ndarray, optional
+        (N, 6) residual buffer to fill and return
+
+    Returns
+    -------
+    tuple
+        (e, err) with e (N, 6) stacked position/orientation residuals and
+        err (N,) their squared norms
+    """
+    e = np.empty((T.shape[0], 6)) if out is None else out
+    np.subtract(pt, T[:, :3, 3], out=e[:, :3])
+
+    R_err = Rt[None] @ T[:, :3, :3].transpose(0, 2, 1)
+    quat = Rotation.from_matrix(R_err).as_quat()  # (x, y, z, w)
+    v = quat[:, :3]
+    w = quat[:, 3]
+    nv = np.linalg.norm(v, axis=1)
+    angle = 2.0 * np.arctan2(nv, np.abs(w))
+    # For tiny errors angle/|v| -> 2, the series limit of the scale factor
+    scale = np.where(nv > 1e-12, angle / np.maximum(nv, 1e-300), 2.0)
+    e[:, 3:] = (scale * np.sign(np.where(w == 0.0, 1.0, w)))[:, None] * v
+    return e, np.einsum('ni,ni->n', e, e)
+
+
+def solve_ik_batch(robot, target_pose, q_seeds, tol=1e-9, ilimit=50, damping=1e-4):
+    """
+    Vectorized damped-least-squares IK over a batch of seed configurations.
+
+    Instead of looping ik_LM over seeds one at a time, every LM step
+    evaluates FK and the geometric Jacobian for all N seeds at once from
+    the shared DH table and solves the stacked (N, 6, 6) normal equations
+    with a single batched np.linalg.solve - BLAS work over the whole batch
+    rather than N Python-level solver calls. The best-residual seed wins,
+    which also raises the success rate on difficult targets.
+
+    Damping is adapted per seed in proper Levenberg-Marquardt fashion:
+    each step is accepted only if it reduces that seed's residual, with
+    lambda shrunk on accept and grown on reject, and the damping term
+    uses Marquardt's diag(J'J) scaling so poorly conditioned directions
+    are damped proportionally harder. This keeps step control entirely
+    per seed while the linear algebra stays batched.
+
+    Parameters
+    ----------
+    robot : DHRobot
+        Robot model (kept for interface parity with the other solvers;
+        the DH chain itself comes from _dh_constants)
+    target_pose : SE3 or ndarray
+        Target pose (SE3 or raw 4x4)
+    q_seeds : array_like
+        (N, 6) seed joint configurations in radians
+    tol : float, optional
+        Convergence threshold on the squared pose-error norm (default: 1e-9)
+    ilimit : int, optional
+        Maximum LM iterations (default: 50)
+    damping : float, optional
+        Initial Levenberg-Marquardt lambda, adapted per seed as iterations
+        are accepted or rejected (default: 1e-4)
+
+    Returns
+    -------
+    IKResult
+        Best solution across the batch (violations is always empty; apply
+        a joint-limit check on the result if needed)
+    """
+    Tt = target_pose.A if hasattr(target_pose, 'A') else np.asarray(target_pose, dtype=np.float64)
+
+    # Fold any constant base/tool transform into the target once, outside
+    # the LM loop; the DH chain in this module is the bare flange chain,
+    # so solving against base^-1 @ T @ tool^-1 is exact and saves two 4x4
+    # multiplies per FK evaluation. PAROL6 ships with identity base and
+    # tool, so the common case skips both inversions.
+    if robot is not None:
+        tool = getattr(robot, 'tool', None)
+        if tool is not None and not np.array_equal(tool.A, np.eye(4)):
+            Tt = Tt @ np.linalg.inv(tool.A)
+        base = getattr(robot, 'base', None)
+        if base is not None and not np.array_equal(base.A, np.eye(4)):
+            Tt = np.linalg.inv(base.A) @ Tt
+
+    Rt = Tt[:3, :3]
+    pt = Tt[:3, 3]
+
+    Q = np.array(q_seeds, dtype=np.float64, ndmin=2)
+    seeds = Q.copy()
+    N = Q.shape[0]
+    diag = np.arange(6)
+    lam = np.full(N, damping)
+
+    # Scratch buffers, allocated once per solve and reused every
+    # iteration - allocator churn is measurable on these tiny arrays
+    cache = _link_transform_cache(Q)
+    cache_new = (cache[0].copy(), cache[1].copy())
+    Q_new = np.empty_like(Q)
+    J = np.empty((N, 6, 6))
+    H = np.empty((N, 6, 6))
+    g = np.empty((N, 6))
+    e_new = np.empty((N, 6))
+
+    e, err = _pose_error_batch(_fk_from_cache(cache), Rt, pt)
+
+    i_best = int(np.argmin(err))
+    best_err = err[i_best]
+    best_q = Q[i_best].copy()
+    best_seed = seeds[i_best]
+    iterations = 0
+
+    for iterations in range(1, ilimit + 1):
+        if best_err < tol:
+            break
+
+        _jacobian_from_cache(cache, out=J)
+        if N == 1 and _jit.NUMBA_AVAILABLE:
+            # Single-seed fast path: the JIT Cholesky kernel beats LAPACK
+            # dispatch on a lone 6x6 system
+            dq = _jit.lm_step_core(J[0], e[0], lam[0])[None]
+        else:
+            JT = J.transpose(0, 2, 1)
+            np.matmul(JT, J, out=H)
+            # Marquardt scaling: damp each direction in proportion to its
+            # own curvature (floored so flat directions stay solvable)
+            D = np.maximum(H[:, diag, diag], 1e-12)
+            H[:, diag, diag] += lam[:, None] * D
+            np.einsum('nij,nj->ni', JT, e, out=g)
+            # Trailing axis keeps np.linalg.solve in batched-vector mode
+            dq = np.linalg.solve(H, g[..., None])[..., 0]
+
+        np.add(Q, dq, out=Q_new)
+        _link_transform_cache(Q_new, out=cache_new)
+        _, err_new = _pose_error_batch(_fk_from_cache(cache_new), Rt, pt,
+                                       out=e_new)
+
+        # Accept only improving steps; shrink lambda toward Gauss-Newton
+        # on accept, grow it (smaller, safer steps) on reject
+        accept = err_new < err
+        lam = np.where(accept, np.maximum(lam * 0.3, 1e-9),
+                       np.minimum(lam * 2.0, 1e3))
+        if accept.all():
+            # Ping-pong the buffers instead of copying
+            Q, Q_new = Q_new, Q
+            cache, cache_new = cache_new, cache
+            e, e_new = e_new, e
+            err = err_new
+        elif accept.any():
+            Q[accept] = Q_new[accept]
+            e[accept] = e_new[accept]
+            err[accept] = err_new[accept]
+            cache[0][accept] = cache_new[0][accept]
+            cache[1][accept] = cache_new[1][accept]
+
+        i_best = int(np.argmin(err))
+        if err[i_best] < best_err:
+            best_err = err[i_best]
+            best_q = Q[i_best].copy()
+            best_seed = seeds[i_best]
+
+    success = bool(best_err < tol)
+    q_out = unwrap_angles(best_q, best_seed) if success else None
+    return IKResult(success, q_out, iterations, best_err, tol, [])
+
+
 class IKSolver:
     """
     Inverse kinematics solver class for PAROL6 robot.
@@ -0,0 +1,125 @@
+"""
+Optional JAX Backend for FK/IK
+==============================
+XLA-compiled forward kinematics over the PAROL6 DH chain, plus a
+least-squares IK built on exact forward-mode Jacobians from jax.jacfwd
+(no finite differencing). XLA fuses the whole chain into one kernel, and
+the same compiled functions batch over configuration stacks via vmap and
+run unmodified on GPU/TPU when one is present.
+
+JAX is not part of this project's requirements (it is a heavy install on
+the Raspberry Pi targets), so everything here is import-guarded the same
+way Numba is in _kinematics_jit: check JAX_AVAILABLE before calling in.
+The NumPy solvers in ik_solver remain the default path.
+"""
+
+import os
+
+import numpy as np
+
+from ._dh_constants import DH_PARAMS
+
+try:
+    import jax
+    import jax.numpy as jnp
+    from jax import lax
+    JAX_AVAILABLE = True
+except ImportError:
+    JAX_AVAILABLE = False
+
+if JAX_AVAILABLE:
+    # Persist XLA-compiled kernels on disk so repeat launches load them
+    # instead of re-tracing and re-compiling (the numba kernels already
+    # do this via cache=True). The cache is keyed on the traced
+    # computation, so editing the DH table invalidates stale entries
+    # automatically. min_compile_time 0 keeps even the small FK kernels.
+    try:
+        jax.config.update(
+            'jax_compilation_cache_dir',
+            os.path.join(os.path.expanduser('~'), '.cache', 'parol6', 'jax'))
+        jax.config.update('jax_persistent_cache_min_compile_time_secs', 0.0)
+    except Exception:
+        # Older JAX releases predate the persistent-cache options; the
+        # backend still works, it just recompiles on every launch.
+        pass
+
+
+def make_fk(dh_params=DH_PARAMS):
+    """
+    Build a jit-compiled fk(q) -> (4, 4) for a standard-DH table.
+
+    The chain is folded with lax.scan over the joint index, so XLA sees
+    one fused kernel regardless of joint count. Batch with
+    jax.vmap(fk) for (N, 6) stacks.
+    """
+    if not JAX_AVAILABLE:
+        raise ImportError("jax is not installed; use robot_model.fkine_batch")
+
+    params = jnp.asarray(dh_params)
+
+    def link_matrix(d, a, alpha, theta):
+        ct, st = jnp.cos(theta), jnp.sin(theta)
+        ca, sa = jnp.cos(alpha), jnp.sin(alpha)
+        return jnp.array([
+            [ct, -st * ca, st * sa, a * ct],
+            [st, ct * ca, -ct * sa, a * st],
+            [0.0, sa, ca, d],
+            [0.0, 0.0, 0.0, 1.0],
+        ])
+
+    def fk(q):
+        def step(T, row):
+            d, a, alpha, offset, qi = row
+            return T @ link_matrix(d, a, alpha, qi + offset), None
+        rows = jnp.column_stack([params, q])
+        T, _ = lax.scan(step, jnp.eye(4), rows)
+        return T
+
+    return jax.jit(fk)
+
+
+def make_ik(fk=None):
+    """
+    Build an ik(target_T, q0) -> (q, success) least-squares solver.
+
+    The residual stacks the position error with the rotation error
+    (difference of the two rotation blocks, flattened - zero exactly at
+    the target orientation), and scipy.optimize.least_squares consumes
+    the exact jacfwd Jacobian with x_scale='jac'. Slower per call than
+    solve_ik_batch but derivative-exact, which pays off on targets near
+    singularities where the damped LM step stalls.
+    """
+    if not JAX_AVAILABLE:
+        raise ImportError("jax is not installed; use ik_solver.solve_ik_batch")
+    from scipy.optimize import least_squares
+
+    if fk is None:
+        fk = make_fk()
+
+    @jax.jit
+    def residual(q, target_T):
+        T = fk(q)
+        pos_err = T[:3, 3] - target_T[:3, 3]
+        rot_err = (T[:3, :3] - target_T[:3, :3]).ravel()
+        return jnp.concatenate([pos_err, rot_err])
+
+    jac = jax.jit(jax.jacfwd(residual))
+
+    def ik(target_T, q0, tol=1e-10):
+        target_T = jnp.asarray(target_T)
+        sol = least_squares(
+            lambda q: np.asarray(residual(q, target_T)),
+            np.asarray(q0, dtype=np.float64),
+            jac=lambda q: np.asarray(jac(q, target_T)),
+            x_scale='jac', ftol=tol, xtol=tol, gtol=tol)
+        return sol.x, sol.cost < 1e-12
+
+    return ik
+
+
+if JAX_AVAILABLE:
+    # Warm-compile at import so the first real query does not pay XLA
+    # tracing latency; the compiled callables are cached module-wide.
+    fk_jax = make_fk()
+    fk_batch_jax = jax.jit(jax.vmap(fk_jax))
+    fk_jax(jnp.zeros(6)).block_until_ready()
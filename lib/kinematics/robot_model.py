@@ -21,16 +21,10 @@ radian_per_step_constant = (2*pi) / (32*200)
 radian_per_sec_2_deg_per_sec_const = 360/ (2*np.pi)
 deg_per_sec_2_radian_per_sec_const = (2*np.pi) / 360
 
-# robot length values (metres)
-a1 = 110.50 / 1000
-a2 = 23.42 / 1000
-a3 = 180 / 1000
-a4 = 43.5 / 1000
-a5 = 176.35 / 1000
-a6 = 34.0 / 1000  # Fixed offset from J5/J6 intersection to J6 flange
-a7 = 0  # No offset - TCP at J5/J6 axis intersection
-
-alpha_DH = [-pi / 2,pi,pi/2,-pi/2,pi/2,pi]
+# robot length values and DH table shared via _dh_constants (single source
+# of truth for the DH parameters, also used by batched FK/IK helpers)
+from ._dh_constants import a1, a2, a3, a4, a5, a6, a7, alpha_DH, DH_PARAMS
+from .ik_solver import _link_transform_cache, _fk_from_cache
 
 robot = DHRobot(
     [
@@ -123,6 +117,22 @@ def STEPS2RADS(Steps,index):
     rads = np.deg2rad(deg)
     return rads
 
+# Per-joint conversion scales for whole-vector conversions. The scalar
+# converters above are linear with zero offset, so a 6-joint conversion
+# collapses to one elementwise multiply instead of six function calls
+# (the scalar forms stay for single-joint call sites).
+STEPS_PER_RAD = (np.rad2deg(1.0) / degree_per_step_constant
+                 * np.asarray(Joint_reduction_ratio))
+RADS_PER_STEP = 1.0 / STEPS_PER_RAD
+
+def RAD2STEPS_VEC(Rads):
+    """Vector form of RAD2STEPS over all six joints at once."""
+    return np.asarray(Rads) * STEPS_PER_RAD
+
+def STEPS2RADS_VEC(Steps):
+    """Vector form of STEPS2RADS over all six joints at once."""
+    return np.asarray(Steps, dtype=np.float64) * RADS_PER_STEP
+
 def RAD2DEG(radian):
     return np.rad2deg(radian)
 
@@ -158,6 +168,106 @@ def DEG_SEC_2_RAD_SEC(deg_per_sec):
     return deg_per_sec * deg_per_sec_2_radian_per_sec_const
 
 
+def link_positions(q):
+    """
+    Get the base-frame position of every link frame in one batched FK pass.
+
+    Uses fkine_all, which computes all intermediate frames in a single
+    sweep, instead of calling fkine(q, end=link) once per link (which
+    recomputes the cumulative chain from the base every time).
+
+    Parameters
+    ----------
+    q : array_like
+        Joint configuration in radians
+
+    Returns
+    -------
+    ndarray
+        (n+1, 3) array of frame origin positions in metres (base included)
+    """
+    Ts = robot.fkine_all(q)
+    return np.array([T.t for T in Ts])
+
+
+def link_relative_transforms(q):
+    """
+    Get each link's local DH transform A_i(q_i) as a 4x4 array.
+
+    The per-link A matrices already are the relative transforms between
+    consecutive frames, so there is no need for the
+    T_i.inv() * T_{i+1} round trip over cumulative transforms.
+
+    Parameters
+    ----------
+    q : array_like
+        Joint configuration in radians
+
+    Returns
+    -------
+    list of ndarray
+        One (4, 4) transform per link
+    """
+    q = np.asarray(q, dtype=float)
+    return [link.A(qi).A for link, qi in zip(robot.links, q)]
+
+
+# Constant factor of each DH link matrix, precomputed at import. The
+# standard-DH link transform factors as Rz(q_i + offset) @ T_const_i with
+# T_const_i = Tz(d_i) @ Tx(a_i) @ Rx(alpha_i) depending only on the table,
+# so per-call work reduces to the six sin/cos pairs and the Rz fold.
+_T_CONST = np.zeros((6, 4, 4))
+for _i in range(6):
+    _d, _a, _alpha = DH_PARAMS[_i, 0], DH_PARAMS[_i, 1], DH_PARAMS[_i, 2]
+    _ca, _sa = np.cos(_alpha), np.sin(_alpha)
+    _T_CONST[_i] = [[1.0, 0.0, 0.0, _a],
+                    [0.0, _ca, -_sa, 0.0],
+                    [0.0, _sa, _ca, _d],
+                    [0.0, 0.0, 0.0, 1.0]]
+del _i, _d, _a, _alpha, _ca, _sa
+
+
+def fkine_fast(q):
+    """
+    Single-configuration FK using the precomputed constant DH factors.
+
+    Only the Rz(q_i + offset) factor depends on q, and left-multiplying
+    by Rz just combines the first two rows of the constant matrix, so
+    each link costs one sin/cos pair and two row updates - no trotz or
+    transl reconstruction. Returns the bare (4, 4) TCP pose.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    T = np.eye(4)
+    for i in range(6):
+        theta = q[i] + DH_PARAMS[i, 3]
+        c, s = np.cos(theta), np.sin(theta)
+        M = _T_CONST[i]
+        A = np.empty((4, 4))
+        A[0] = c * M[0] - s * M[1]
+        A[1] = s * M[0] + c * M[1]
+        A[2:] = M[2:]
+        T = T @ A
+    return T
+
+
+def fkine_batch(q):
+    """
+    Forward kinematics over a stack of joint configurations.
+
+    Accepts a (6,) vector or an (N, 6) array and returns the matching
+    (4, 4) or (N, 4, 4) array of TCP poses. Runs the whole DH chain with
+    NumPy broadcasting via the batched helpers in ik_solver, so one call
+    on N configurations pays the Python and SE3 overhead of a single
+    robot.fkine call. Returns raw ndarrays; wrap in SE3 only at API
+    boundaries that need it.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    single = q.ndim == 1
+    cache = _link_transform_cache(q[None] if single else q)
+    T = _fk_from_cache(cache)
+    return T[0] if single else T
+
+
 def check_joint_limits(q, target_q=None, allow_recovery=True):
     """
     Check if joint angles are within their limits, with support for recovery movements.
@@ -14,11 +14,15 @@ Compatible with:
 """
 
 import sys
+import math
+import base64
 import warnings
 import logging
+import functools
+import threading
 from collections import namedtuple
 from roboticstoolbox import DHRobot
-from spatialmath.base import trinterp
+from spatialmath.base import trinterp, rpy2r
 
 # Get module logger
 logger = logging.getLogger(__name__)
@@ -32,7 +36,7 @@ try:
         warnings.warn(f"NumPy version {np.__version__} detected. Recommended: 1.23.4")
     
     from scipy.interpolate import CubicSpline
-    from scipy.spatial.transform import Rotation, Slerp
+    from scipy.spatial.transform import Rotation, Slerp, RotationSpline
     import scipy
     # Check scipy version
     scipy_version = tuple(map(int, scipy.__version__.split('.')[:2]))
@@ -71,6 +75,30 @@ from .ik_solver import (
     calculate_configuration_dependent_max_reach,
     solve_ik_with_adaptive_tol_subdivision
 )
+from .fk_codegen import fk6
+from . import _kinematics_jit as _jit
+
+# Memo for the verbose wrapper: streaming/jog workloads frequently repeat
+# the exact (target, seed) pair, and a hit skips the whole solve. The lock
+# guards the evict+insert pair: _precompute_q_table solves segments on a
+# thread pool, and two workers evicting the same oldest key would raise
+# KeyError out of a perfectly good solve.
+_ik_memo = {}
+_IK_MEMO_MAX = 256
+_ik_memo_lock = threading.Lock()
+
+
+def _ik_memo_store(key, result):
+    """Insert a solve result into the memo, evicting under the lock."""
+    with _ik_memo_lock:
+        if len(_ik_memo) >= _IK_MEMO_MAX:
+            # Drop the oldest entry (dicts preserve insertion order)
+            _ik_memo.pop(next(iter(_ik_memo)))
+        _ik_memo[key] = result
+
+# Squared pose-error norm below which the seed already satisfies the
+# target and the LM solver can be skipped entirely
+_SEED_HIT_TOL = 1e-12
 
 # Wrapper function to maintain compatibility with existing code
 # This version adds extra logging for smooth_motion module
@@ -88,7 +116,35 @@ def solve_ik_with_adaptive_tol_subdivision_verbose(
 
     This maintains backward compatibility while using the centralized IK solver.
     """
-    logger.info(f"[SmoothMotion IK] Starting: target={target_pose.t}, seed={np.degrees(current_q)}")
+    # Gate on the log level before formatting: np.degrees plus f-string
+    # rendering of two arrays is measurable at the 100 Hz call rate, and
+    # it is wasted work whenever INFO is filtered out.
+    verbose = logger.isEnabledFor(logging.INFO)
+    if verbose:
+        logger.info("[SmoothMotion IK] Starting: target=%s, seed=%s",
+                    target_pose.t, np.degrees(current_q))
+
+    Tt = target_pose.A if hasattr(target_pose, 'A') else np.asarray(target_pose, dtype=np.float64)
+    q_arr = np.asarray(current_q, dtype=np.float64)
+
+    memo_key = (Tt.tobytes(), q_arr.tobytes(), bool(jogging))
+    cached = _ik_memo.get(memo_key)
+    if cached is not None:
+        return cached
+
+    # FK at the seed first: when streaming closely spaced waypoints the
+    # seed often already satisfies the target, and the specialized fk6 is
+    # orders of magnitude cheaper than even one LM iteration.
+    T_seed = fk6(q_arr)
+    e_pos = Tt[:3, 3] - T_seed[:3, 3]
+    e_rot = 0.5 * np.cross(T_seed[:3, :3].T, Tt[:3, :3].T).sum(axis=0)
+    seed_err = e_pos @ e_pos + e_rot @ e_rot
+    if seed_err < _SEED_HIT_TOL:
+        result = IKResult(True, q_arr, 0, seed_err, _SEED_HIT_TOL, [])
+        _ik_memo_store(memo_key, result)
+        if verbose:
+            logger.info("[SmoothMotion IK] ✓ SUCCESS - seed already on target")
+        return result
 
     # Use centralized IK solver with joint limits checker
     joint_limits_checker = None
@@ -107,7 +163,10 @@ def solve_ik_with_adaptive_tol_subdivision_verbose(
     )
 
     if result.success:
-        logger.info(f"[SmoothMotion IK] ✓ SUCCESS - solution={np.degrees(result.q)}")
+        _ik_memo_store(memo_key, result)
+        if verbose:
+            logger.info("[SmoothMotion IK] ✓ SUCCESS - solution=%s",
+                        np.degrees(result.q))
     else:
         reason = f"Joint limit violations: {result.violations}" if result.violations else "IK solver failed"
         logger.warning(f"[SmoothMotion IK] ✗ FAILED - {reason}")
@@ -124,6 +183,135 @@ solve_ik_with_adaptive_tol_subdivision = solve_ik_with_adaptive_tol_subdivision_
 # END OF IK SOLVER FUNCTIONS
 # ============================================================================
 
+def _pose_matrix_from_xyz_rpy(xyz_mm, rpy_deg):
+    """
+    Build a raw (4, 4) homogeneous matrix from position (mm) and xyz Euler
+    angles (degrees).
+
+    Assembles [[R, t], [0, 1]] directly instead of composing
+    SE3(x, y, z) * SE3.RPY(...), which allocates two SE3 objects and
+    performs a full 4x4 multiply just to place the translation column.
+    Both forms are algebraically identical here (the left factor is a pure
+    translation). Returning the bare ndarray lets callers that only need
+    the matrix (interpolation, error norms) skip the SE3 wrapper entirely.
+    """
+    T = np.eye(4)
+    T[:3, :3] = rpy2r(np.asarray(rpy_deg, dtype=np.float64), unit='deg', order='xyz')
+    T[:3, 3] = np.asarray(xyz_mm, dtype=np.float64) / 1000.0
+    return T
+
+
+def _pose_from_xyz_rpy(xyz_mm, rpy_deg):
+    """SE3 wrapper over _pose_matrix_from_xyz_rpy for API boundaries."""
+    return SE3(_pose_matrix_from_xyz_rpy(xyz_mm, rpy_deg), check=False)
+
+
+# Reference axes for perpendicular-vector construction; module-level so
+# they are not re-wrapped into arrays on every call
+_AXIS_X = np.array([1.0, 0.0, 0.0])
+_AXIS_Y = np.array([0.0, 1.0, 0.0])
+
+# Entries kept per TrajectoryGenerator instance cache (FIFO eviction)
+_TRAJ_CACHE_MAX = 64
+
+
+def _cache_key_part(value):
+    """Convert an argument into a hashable cache-key component.
+
+    Floats are rounded so values that differ only by representation noise
+    share an entry; lists and arrays become nested tuples.
+    """
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(_cache_key_part(v) for v in value)
+    if isinstance(value, float):
+        return round(value, 9)
+    return value
+
+
+def _cache_trajectory(func):
+    """Memoize a trajectory-generation method in self.trajectory_cache.
+
+    Scripted cycles and demos replay identical motions; a hit returns a
+    copy of the stored array (callers overwrite row 0 in place) instead
+    of regenerating. Unhashable arguments fall through to a plain call.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            key = (func.__name__, self.control_rate, _cache_key_part(args),
+                   tuple(sorted(
+                       (k, _cache_key_part(v)) for k, v in kwargs.items())))
+        except TypeError:
+            return func(self, *args, **kwargs)
+        cached = self.trajectory_cache.get(key)
+        if cached is None:
+            cached = func(self, *args, **kwargs)
+            if len(self.trajectory_cache) >= _TRAJ_CACHE_MAX:
+                self.trajectory_cache.pop(next(iter(self.trajectory_cache)))
+            self.trajectory_cache[key] = cached
+        return cached.copy()
+    return wrapper
+
+
+@functools.lru_cache(maxsize=32)
+def _timestamps_cached(duration, control_rate):
+    """Shared read-only timestamp vector for a (duration, rate) pair."""
+    ts = np.linspace(0, duration, int(duration * control_rate))
+    ts.setflags(write=False)
+    return ts
+
+
+@functools.lru_cache(maxsize=4096)
+def _rodrigues_matrix(kx, ky, kz, angle):
+    """
+    Rodrigues rotation matrix from scalar axis components and angle.
+
+    Scalar arguments keep the signature hashable for the lru_cache:
+    trajectory replays reuse the same plane normal and quantized angle
+    steps, so repeat calls become a dict lookup instead of trig plus two
+    matrix products. Treat the returned array as read-only - it is the
+    cached object itself. Cache misses run the compiled kernel in
+    _kinematics_jit, which writes the nine entries directly.
+    """
+    return _jit.rodrigues_core(kx, ky, kz, angle)
+
+
+def _slerp_quat(q0, q1, t):
+    """
+    Closed-form quaternion slerp, scalar or vector t in [0, 1].
+
+    q(t) = (sin((1-t)*theta)*q0 + sin(t*theta)*q1) / sin(theta), with q1
+    sign-flipped when the dot product is negative so interpolation takes
+    the short great-circle arc, and a normalized-lerp fallback when the
+    quaternions are nearly parallel (sin(theta) -> 0). A dozen FLOPs in
+    place of building Rotation and Slerp objects per evaluation.
+    """
+    q0 = np.asarray(q0, dtype=np.float64)
+    q1 = np.asarray(q1, dtype=np.float64)
+
+    # Scalar t (the per-step path) goes through the compiled kernel; the
+    # array-t branches below cover the whole-trajectory vectorized calls
+    if np.ndim(t) == 0:
+        return _jit.slerp_quat_core(q0, q1, float(t))
+
+    d = float(np.dot(q0, q1))
+    if d < 0.0:
+        q1 = -q1
+        d = -d
+
+    # A trailing axis on t broadcasts against the quaternion components,
+    # collapsing back to (4,) for scalar t and (N, 4) for vector t
+    tc = np.asarray(t, dtype=np.float64)[..., None]
+
+    if d > 0.9995:
+        out = q0 + tc * (q1 - q0)
+        return out / np.linalg.norm(out, axis=-1, keepdims=True)
+
+    theta = math.acos(min(d, 1.0))
+    s = math.sin(theta)
+    return (np.sin((1.0 - tc) * theta) * q0 + np.sin(tc * theta) * q1) / s
+
+
 class TrajectoryGenerator:
     """Base class for trajectory generation with caching support"""
     
@@ -140,14 +328,17 @@ class TrajectoryGenerator:
         
     def generate_timestamps(self, duration: float) -> np.ndarray:
         """Generate evenly spaced timestamps for trajectory"""
-        num_points = int(duration * self.control_rate)
-        return np.linspace(0, duration, num_points)
+        # Demos cycle through a handful of durations, so the linspace is
+        # memoized; the returned array is marked read-only because every
+        # caller only derives new arrays from it
+        return _timestamps_cached(round(duration, 4), self.control_rate)
 
 class CircularMotion(TrajectoryGenerator):
     """Generate circular and arc trajectories in 3D space"""
     
-    def generate_arc_3d(self, 
-                       start_pose: List[float], 
+    @_cache_trajectory
+    def generate_arc_3d(self,
+                       start_pose: List[float],
                        end_pose: List[float], 
                        center: List[float], 
                        normal: Optional[List[float]] = None,
@@ -198,32 +389,38 @@ class CircularMotion(TrajectoryGenerator):
         if clockwise:
             arc_angle = -arc_angle
             
-        # Generate trajectory points
+        # Generate trajectory points - all at once. The per-point loop
+        # rebuilt a Rodrigues matrix and a two-key Slerp object for every
+        # timestep; here the axis-angle rotation is applied to r1 directly
+        # (v*cos + (k x v)*sin + k*(k.v)*(1-cos)), so no (N, 3, 3) matrix
+        # stack is ever built, and one Slerp call interpolates every
+        # orientation.
         timestamps = self.generate_timestamps(duration)
-        trajectory = []
-        
-        for i, t in enumerate(timestamps):
-            # Interpolation factor
-            s = t / duration
-            
-            # For first point, use exact start position
-            if i == 0:
-                current_pos = start_pos
-            else:
-                # Rotate radius vector
-                angle = s * arc_angle
-                rot_matrix = self._rotation_matrix_from_axis_angle(normal, angle)
-                current_pos = center_pt + rot_matrix @ r1
-            
-            # Interpolate orientation (SLERP)
-            current_orient = self._slerp_orientation(start_pose[3:], end_pose[3:], s)
-            
-            # Combine position and orientation
-            pose = np.concatenate([current_pos, current_orient])
-            trajectory.append(pose)
-            
-        return np.array(trajectory)
+        s = timestamps / duration
+        angles = s * arc_angle
+
+        k_cross_r1 = np.cross(normal, r1)
+        k_dot_r1 = np.dot(normal, r1)
+        cos_a = np.cos(angles)[:, None]
+        sin_a = np.sin(angles)[:, None]
+
+        trajectory = np.zeros((len(timestamps), 6))
+        trajectory[:, :3] = (center_pt + cos_a * r1 + sin_a * k_cross_r1
+                             + (1 - cos_a) * (k_dot_r1 * normal))
+        # First point uses the exact start position
+        trajectory[0, :3] = start_pos
+
+        # Orientation stays in quaternion space between the two boundary
+        # conversions: one batched from_euler for the endpoints, the
+        # closed-form slerp over the whole factor vector, one as_euler out
+        q_keys = Rotation.from_euler(
+            'xyz', [start_pose[3:], end_pose[3:]], degrees=True).as_quat()
+        trajectory[:, 3:] = Rotation.from_quat(
+            _slerp_quat(q_keys[0], q_keys[1], s)).as_euler('xyz', degrees=True)
+
+        return trajectory
     
+    @_cache_trajectory
     def generate_circle_3d(self,
                       center: List[float],
                       radius: float,
@@ -235,8 +432,7 @@ class CircularMotion(TrajectoryGenerator):
         Generate a complete circle trajectory that starts at start_point
         """
         timestamps = self.generate_timestamps(duration)
-        trajectory = []
-        
+
         # Create orthonormal basis for circle plane
         normal = np.array(normal) / np.linalg.norm(normal)
         u = self._get_perpendicular_vector(normal)
@@ -289,65 +485,49 @@ class CircularMotion(TrajectoryGenerator):
             start_angle = 0 if start_angle is None else start_angle
             actual_start = None
         
-        # Generate the circle 
-        for i, t in enumerate(timestamps):
-            if i == 0 and actual_start is not None:
-                # First point MUST be exactly the start point
-                pos = actual_start
-            else:
-                # Generate circle points
-                angle = start_angle + (2 * np.pi * t / duration)
-                pos = center_np + radius * (np.cos(angle) * u + np.sin(angle) * v)
-            
-            # Placeholder orientation (will be overridden)
-            orient = [0, 0, 0]
-            trajectory.append(np.concatenate([pos, orient]))
-        
-        return np.array(trajectory)
+        # Generate the circle in one vectorized expression: all angles at
+        # once, positions as an (N, 3) outer-product sum, orientation
+        # columns left zero (placeholder, overridden downstream)
+        angles = start_angle + 2 * np.pi * timestamps / duration
+        trajectory = np.zeros((len(timestamps), 6))
+        trajectory[:, :3] = center_np + radius * (
+            np.cos(angles)[:, None] * u + np.sin(angles)[:, None] * v)
+
+        if actual_start is not None:
+            # First point MUST be exactly the start point
+            trajectory[0, :3] = actual_start
+
+        return trajectory
     
     def _rotation_matrix_from_axis_angle(self, axis: np.ndarray, angle: float) -> np.ndarray:
-        """Generate rotation matrix using Rodrigues' formula"""
-        axis = axis / np.linalg.norm(axis)
-        cos_a = np.cos(angle)
-        sin_a = np.sin(angle)
-        
-        # Cross-product matrix
-        K = np.array([[0, -axis[2], axis[1]],
-                     [axis[2], 0, -axis[0]],
-                     [-axis[1], axis[0], 0]])
-        
-        # Rodrigues' formula
-        R = np.eye(3) + sin_a * K + (1 - cos_a) * K @ K
-        return R
+        """Generate rotation matrix using Rodrigues' formula (cached)"""
+        # Delegates to the module-level lru_cache; the vectorized arc path
+        # builds its whole (N, 3, 3) stack in one shot and bypasses this.
+        return _rodrigues_matrix(float(axis[0]), float(axis[1]),
+                                 float(axis[2]), float(angle))
     
     def _get_perpendicular_vector(self, v: np.ndarray) -> np.ndarray:
         """Find a vector perpendicular to the given vector"""
         v = np.array(v)  # Ensure it's a numpy array
-        if abs(v[0]) < 0.9:
-            return np.cross(v, [1, 0, 0]) / np.linalg.norm(np.cross(v, [1, 0, 0]))
-        else:
-            return np.cross(v, [0, 1, 0]) / np.linalg.norm(np.cross(v, [0, 1, 0]))
+        axis = _AXIS_X if abs(v[0]) < 0.9 else _AXIS_Y
+        perp = np.cross(v, axis)
+        return perp / np.linalg.norm(perp)
     
-    def _slerp_orientation(self, start_orient: List[float], 
-                          end_orient: List[float], 
+    def _slerp_orientation(self, start_orient: List[float],
+                          end_orient: List[float],
                           t: float) -> np.ndarray:
         """Spherical linear interpolation for orientation"""
-        # Convert to quaternions
-        r1 = Rotation.from_euler('xyz', start_orient, degrees=True)
-        r2 = Rotation.from_euler('xyz', end_orient, degrees=True)
-        
-        # Create slerp object - compatible with scipy 1.11.4
-        # Stack rotations into a single Rotation object
-        key_rots = Rotation.from_quat([r1.as_quat(), r2.as_quat()])
-        slerp = Slerp([0, 1], key_rots)
-        
-        # Interpolate
-        interp_rot = slerp(t)
-        return interp_rot.as_euler('xyz', degrees=True)
+        # Convert to quaternions once and interpolate with the
+        # closed-form slerp; no Rotation-stack or Slerp object per call
+        q0 = Rotation.from_euler('xyz', start_orient, degrees=True).as_quat()
+        q1 = Rotation.from_euler('xyz', end_orient, degrees=True).as_quat()
+        return Rotation.from_quat(_slerp_quat(q0, q1, t)).as_euler(
+            'xyz', degrees=True)
 
 class SplineMotion(TrajectoryGenerator):
     """Generate smooth spline trajectories through waypoints"""
     
+    @_cache_trajectory
     def generate_cubic_spline(self,
                              waypoints: List[List[float]],
                              timestamps: Optional[List[float]] = None,
@@ -370,50 +550,41 @@ class SplineMotion(TrajectoryGenerator):
         
         # Auto-generate timestamps if not provided
         if timestamps is None:
-            # Estimate based on distance
-            total_dist = 0
-            for i in range(1, num_waypoints):
-                dist = np.linalg.norm(waypoints[i, :3] - waypoints[i-1, :3])
-                total_dist += dist
-            
+            # Estimate based on distance: one vectorized norm over all
+            # consecutive waypoint differences
+            total_dist = np.linalg.norm(
+                np.diff(waypoints[:, :3], axis=0), axis=1).sum()
+
             # Assume average speed of 50 mm/s
             total_time = total_dist / 50.0
             timestamps = np.linspace(0, total_time, num_waypoints)
         
-        # Create splines for position
-        pos_splines = []
-        for i in range(3):
-            bc_type = 'not-a-knot'  # Default boundary condition
-            
-            # Apply velocity boundary conditions if specified
-            if velocity_start is not None and velocity_end is not None:
-                bc_type = ((1, velocity_start[i]), (1, velocity_end[i]))
-            
-            spline = CubicSpline(timestamps, waypoints[:, i], bc_type=bc_type)
-            pos_splines.append(spline)
-        
-        # Create splines for orientation (convert to quaternions for smooth interpolation)
-        rotations = [Rotation.from_euler('xyz', wp[3:], degrees=True) for wp in waypoints]
-        # Stack quaternions for scipy 1.11.4 compatibility
-        quats = np.array([r.as_quat() for r in rotations])
-        key_rots = Rotation.from_quat(quats)
-        slerp = Slerp(timestamps, key_rots)
-        
+        # One vector-valued spline over all three position axes: CubicSpline
+        # interpolates along axis 0 and evaluates the full t_eval array in a
+        # single call, replacing three per-axis splines each evaluated in a
+        # per-t Python loop
+        bc_type = 'not-a-knot'  # Default boundary condition
+        if velocity_start is not None and velocity_end is not None:
+            bc_type = ((1, np.asarray(velocity_start, dtype=np.float64)),
+                       (1, np.asarray(velocity_end, dtype=np.float64)))
+        pos_spline = CubicSpline(timestamps, waypoints[:, :3], bc_type=bc_type)
+
+        # Orientation: one batched Euler->rotation conversion, then a
+        # RotationSpline instead of Slerp - Slerp is only piecewise-linear
+        # in quaternion space, with angular-velocity jumps at every
+        # waypoint, while RotationSpline matches the C2 continuity of the
+        # cubic position spline. Evaluation is still a single vectorized
+        # call over the whole timestamp vector.
+        key_rots = Rotation.from_euler('xyz', waypoints[:, 3:], degrees=True)
+        rot_spline = RotationSpline(timestamps, key_rots)
+
         # Generate dense trajectory
         t_eval = self.generate_timestamps(timestamps[-1])
-        trajectory = []
-        
-        for t in t_eval:
-            # Evaluate position splines
-            pos = [spline(t) for spline in pos_splines]
-            
-            # Evaluate orientation
-            rot = slerp(t)
-            orient = rot.as_euler('xyz', degrees=True)
-            
-            trajectory.append(np.concatenate([pos, orient]))
-        
-        return np.array(trajectory)
+        trajectory = np.empty((len(t_eval), 6))
+        trajectory[:, :3] = pos_spline(t_eval)
+        trajectory[:, 3:] = rot_spline(t_eval).as_euler('xyz', degrees=True)
+
+        return trajectory
     
     def generate_quintic_spline(self,
                                waypoints: List[List[float]],
@@ -460,33 +631,32 @@ class MotionBlender:
         blend_start_pose = traj1[overlap_start] if overlap_start < len(traj1) else traj1[-1]
         blend_end_pose = traj2[overlap_end] if overlap_end < len(traj2) else traj2[0]
         
-        # Generate smooth transition using S-curve
-        blended = []
-        for i in range(blend_samples):
-            t = i / (blend_samples - 1)
-            # Use smoothstep function for smoother acceleration
-            s = t * t * (3 - 2 * t)  # Smoothstep
-            
-            # Blend position
-            pos_blend = blend_start_pose * (1 - s) + blend_end_pose * s
-            
-            # For orientation, use SLERP
-            r1 = Rotation.from_euler('xyz', blend_start_pose[3:], degrees=True)
-            r2 = Rotation.from_euler('xyz', blend_end_pose[3:], degrees=True)
-            key_rots = Rotation.from_quat([r1.as_quat(), r2.as_quat()])
-            slerp = Slerp([0, 1], key_rots)
-            orient_blend = slerp(s).as_euler('xyz', degrees=True)
-            
-            pos_blend[3:] = orient_blend
-            blended.append(pos_blend)
-        
-        # Combine with better overlap handling
-        result = np.vstack([
-            traj1[:overlap_start],
-            np.array(blended),
-            traj2[overlap_end:]
-        ])
-        
+        # Generate smooth transition using S-curve. Positions blend as a
+        # single outer-product expression; orientation is converted to
+        # quaternions once, slerped over the whole smoothstep vector in
+        # quaternion space, and converted back once at the boundary.
+        t = np.linspace(0.0, 1.0, blend_samples)
+        s = t * t * (3 - 2 * t)  # Smoothstep
+
+        # The full result is preallocated once and every piece written
+        # into its slice - no intermediate blended array and no vstack
+        # copy of the two input trajectories
+        n_head = overlap_start
+        n_tail = len(traj2) - overlap_end
+        result = np.empty((n_head + blend_samples + n_tail, 6))
+        result[:n_head] = traj1[:overlap_start]
+        result[n_head + blend_samples:] = traj2[overlap_end:]
+
+        blended = result[n_head:n_head + blend_samples]
+        blended[:] = ((1 - s)[:, None] * blend_start_pose
+                      + s[:, None] * blend_end_pose)
+
+        q_keys = Rotation.from_euler(
+            'xyz', [blend_start_pose[3:], blend_end_pose[3:]],
+            degrees=True).as_quat()
+        blended[:, 3:] = Rotation.from_quat(
+            _slerp_quat(q_keys[0], q_keys[1], s)).as_euler('xyz', degrees=True)
+
         return result
 
 class SmoothMotionCommand:
@@ -505,42 +675,113 @@ class SmoothMotionCommand:
         self.current_index = 0
         self.is_finished = False
         self.is_valid = True
-        
+        self.q_table = None  # (N, 6) joint angles, filled by prepare_for_execution
+        self.steps_table = None  # (N, 6) int step targets, same lifetime
+
     def prepare_for_execution(self, current_position_in):
-        """Validate trajectory is reachable from current position"""
+        """Precompute IK for the whole trajectory before execution starts"""
         # Check if IK solver is available
         if solve_ik_with_adaptive_tol_subdivision is None:
             logger.warning("Warning: IK solver not available, skipping validation")
             self.is_valid = True
             return True
-            
+
         try:
             # Convert current position to radians
-            current_q = np.array([PAROL6_ROBOT.STEPS2RADS(p, i) 
-                                 for i, p in enumerate(current_position_in)])
-            
-            # Check first waypoint is reachable
-            first_pose = self.trajectory[0]
-            target_se3 = SE3(first_pose[0]/1000, first_pose[1]/1000, first_pose[2]/1000) * \
-                        SE3.RPY(first_pose[3:], unit='deg', order='xyz')
-            
-            ik_result = solve_ik_with_adaptive_tol_subdivision(
-                PAROL6_ROBOT.robot, target_se3, current_q, ilimit=20
-            )
-            
-            if not ik_result.success:
-                logger.error(f"Smooth motion validation failed: Cannot reach first waypoint")
+            current_q = PAROL6_ROBOT.STEPS2RADS_VEC(current_position_in)
+
+            # The trajectory is fully known here, so solve IK for every
+            # waypoint now instead of once per 100 Hz control tick. Each
+            # solve is warm-started from the previous waypoint's solution,
+            # which keeps the per-point cost to a few LM iterations, and
+            # execute_step reduces to an array lookup.
+            q_table = self._precompute_q_table(current_q)
+            if q_table is None:
                 self.is_valid = False
                 return False
-                
+
+            self.q_table = q_table
+            # Step conversion is linear, so the whole table converts in
+            # one vectorized multiply here; the control tick then indexes
+            # precomputed integers with no per-tick conversion at all
+            self.steps_table = PAROL6_ROBOT.RAD2STEPS_VEC(q_table).astype(int)
             logger.info(f"Smooth motion prepared with {len(self.trajectory)} waypoints")
             return True
-            
+
         except Exception as e:
             logger.error(f"Smooth motion preparation error: {e}")
             self.is_valid = False
             return False
-    
+
+    def _solve_segment(self, q_table, start, stop, seed_q):
+        """Fill q_table[start:stop] sequentially, warm-started from seed_q.
+
+        Returns the index of the first unreachable waypoint, or -1 if the
+        whole segment solved.
+        """
+        for k in range(start, stop):
+            pose = self.trajectory[k]
+            target_se3 = _pose_from_xyz_rpy(pose[:3], pose[3:])
+            ik_result = solve_ik_with_adaptive_tol_subdivision(
+                PAROL6_ROBOT.robot, target_se3, seed_q, ilimit=20
+            )
+            if not ik_result.success:
+                return k
+            q_table[k] = ik_result.q
+            seed_q = q_table[k]
+        return -1
+
+    _PARALLEL_PRECOMPUTE_MIN = 64
+
+    def _precompute_q_table(self, current_q):
+        """Solve IK for all waypoints, in parallel segments when large.
+
+        Short trajectories run one sequential warm-start chain. Longer
+        ones are split into per-worker segments: the segment-boundary
+        waypoints are solved first in a serial chain (one solve per
+        segment, so each segment has a good local seed), then the segment
+        interiors run concurrently on a thread pool. ik_LM releases the
+        GIL, so threads scale here the same way they do in
+        solve_ik_multistart, without the robot-model pickling a process
+        pool would pay. Returns the (N, 6) table or None on failure.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        n = len(self.trajectory)
+        q_table = np.empty((n, 6))
+        num_workers = min(4, max(1, n // self._PARALLEL_PRECOMPUTE_MIN))
+        if num_workers == 1:
+            bad = self._solve_segment(q_table, 0, n, current_q)
+            if bad >= 0:
+                logger.error(f"Smooth motion validation failed: Cannot reach waypoint {bad}")
+                return None
+            return q_table
+
+        bounds = np.linspace(0, n, num_workers + 1).astype(int)
+        # Serial pass over segment heads: each seeds from the previous
+        # head's solution, giving every worker a nearby starting point
+        seed_q = current_q
+        for s in range(num_workers):
+            bad = self._solve_segment(q_table, bounds[s], bounds[s] + 1, seed_q)
+            if bad >= 0:
+                logger.error(f"Smooth motion validation failed: Cannot reach waypoint {bad}")
+                return None
+            seed_q = q_table[bounds[s]]
+
+        with ThreadPoolExecutor(max_workers=num_workers) as pool:
+            futures = [
+                pool.submit(self._solve_segment, q_table,
+                            bounds[s] + 1, bounds[s + 1], q_table[bounds[s]])
+                for s in range(num_workers)
+            ]
+            results = [f.result() for f in futures]
+
+        bad = min((r for r in results if r >= 0), default=-1)
+        if bad >= 0:
+            logger.error(f"Smooth motion validation failed: Cannot reach waypoint {bad}")
+            return None
+        return q_table
+
     def execute_step(self, Position_in, Speed_out, Command_out, **kwargs):
         """Execute one step of the smooth motion"""
         if self.is_finished or not self.is_valid:
@@ -565,33 +806,31 @@ class SmoothMotionCommand:
             Command_out.value = 255
             return True
         
-        # Get current target pose
-        target_pose = self.trajectory[self.current_index]
-        
-        # Convert to SE3
-        target_se3 = SE3(target_pose[0]/1000, target_pose[1]/1000, target_pose[2]/1000) * \
-                    SE3.RPY(target_pose[3:], unit='deg', order='xyz')
-        
-        # Get current joint configuration
-        current_q = np.array([PAROL6_ROBOT.STEPS2RADS(p, i) 
-                             for i, p in enumerate(Position_in)])
-        
-        # Solve IK
-        ik_result = solve_ik_with_adaptive_tol_subdivision(
-            PAROL6_ROBOT.robot, target_se3, current_q, ilimit=20
-        )
-        
-        if not ik_result.success:
-            logger.error(f"IK failed at trajectory point {self.current_index}")
-            self.is_finished = True
-            Speed_out[:] = [0] * 6
-            Command_out.value = 255
-            return True
-        
-        # Convert to steps and send
-        target_steps = [int(PAROL6_ROBOT.RAD2STEPS(q, i)) 
-                       for i, q in enumerate(ik_result.q)]
-        
+        # Step targets come from the tables precomputed in
+        # prepare_for_execution - the 100 Hz loop does no IK, no SE3
+        # construction and no unit conversion, just an array lookup. The
+        # per-tick solve only remains as a fallback for callers that skip
+        # the preparation step.
+        if self.steps_table is not None:
+            target_steps = self.steps_table[self.current_index]
+        else:
+            target_pose = self.trajectory[self.current_index]
+            target_se3 = _pose_from_xyz_rpy(target_pose[:3], target_pose[3:])
+            current_q = PAROL6_ROBOT.STEPS2RADS_VEC(Position_in)
+            ik_result = solve_ik_with_adaptive_tol_subdivision(
+                PAROL6_ROBOT.robot, target_se3, current_q, ilimit=20
+            )
+            if not ik_result.success:
+                logger.error(f"IK failed at trajectory point {self.current_index}")
+                self.is_finished = True
+                Speed_out[:] = [0] * 6
+                Command_out.value = 255
+                return True
+            # Convert to steps; astype(int) truncates toward zero,
+            # matching the previous per-joint int() casts
+            target_steps = PAROL6_ROBOT.RAD2STEPS_VEC(ik_result.q).astype(int)
+
+
         # Calculate velocities for smooth following
         for i in range(6):
             Speed_out[i] = int((target_steps[i] - Position_in[i]) * 10)  # P-control factor
@@ -601,7 +840,42 @@ class SmoothMotionCommand:
 
 # Helper functions for integration with robot_api.py
 
-def execute_circle(center: List[float], 
+# Legacy ASCII payloads (one str() call per value, two nested joins)
+# dominate the execute_* helpers at trajectory sizes in the hundreds;
+# set True only when a human needs to read the command string.
+SERIALIZE_ASCII = False
+
+
+def _serialize_traj(kind: str, trajectory: np.ndarray) -> str:
+    """
+    Pack a trajectory into a SMOOTH_MOTION command string.
+
+    The default format is the little-endian float32 array bytes,
+    base64-encoded, under a '<KIND>_B64' tag - one vectorized astype plus
+    one b64encode, about 3x smaller than the ASCII form and built without
+    any per-value Python work. float32 keeps ~0.1 um / microdegree
+    resolution, far below what the steppers resolve. decode_trajectory
+    reverses both formats.
+    """
+    if SERIALIZE_ASCII:
+        traj_str = "|".join([",".join(map(str, pose)) for pose in trajectory])
+        return f"SMOOTH_MOTION|{kind}|{traj_str}"
+    payload = base64.b64encode(
+        np.ascontiguousarray(trajectory, dtype='<f4').tobytes()).decode('ascii')
+    return f"SMOOTH_MOTION|{kind}_B64|{payload}"
+
+
+def decode_trajectory(command: str) -> np.ndarray:
+    """Recover the (N, 6) trajectory array from a SMOOTH_MOTION command."""
+    _, kind, payload = command.split("|", 2)
+    if kind.endswith("_B64"):
+        flat = np.frombuffer(base64.b64decode(payload), dtype='<f4')
+        return flat.astype(np.float64).reshape(-1, 6)
+    return np.array([[float(v) for v in pose.split(",")]
+                     for pose in payload.split("|")])
+
+
+def execute_circle(center: List[float],
                   radius: float, 
                   duration: float = 4.0,
                   normal: List[float] = [0, 0, 1]) -> str:
@@ -620,11 +894,7 @@ def execute_circle(center: List[float],
     motion_gen = CircularMotion()
     trajectory = motion_gen.generate_circle_3d(center, radius, normal, 0, duration)
     
-    # Convert to command string format
-    traj_str = "|".join([",".join(map(str, pose)) for pose in trajectory])
-    command = f"SMOOTH_MOTION|CIRCLE|{traj_str}"
-    
-    return command
+    return _serialize_traj("CIRCLE", trajectory)
 
 def execute_arc(start_pose: List[float],
                end_pose: List[float],
@@ -648,11 +918,7 @@ def execute_arc(start_pose: List[float],
     trajectory = motion_gen.generate_arc_3d(start_pose, end_pose, center, 
                                            clockwise=clockwise, duration=duration)
     
-    # Convert to command string format
-    traj_str = "|".join([",".join(map(str, pose)) for pose in trajectory])
-    command = f"SMOOTH_MOTION|ARC|{traj_str}"
-    
-    return command
+    return _serialize_traj("ARC", trajectory)
 
 def execute_spline(waypoints: List[List[float]], 
                   total_time: Optional[float] = None) -> str:
@@ -675,11 +941,7 @@ def execute_spline(waypoints: List[List[float]],
     
     trajectory = motion_gen.generate_cubic_spline(waypoints, timestamps)
     
-    # Convert to command string format
-    traj_str = "|".join([",".join(map(str, pose)) for pose in trajectory])
-    command = f"SMOOTH_MOTION|SPLINE|{traj_str}"
-    
-    return command
+    return _serialize_traj("SPLINE", trajectory)
 
 # Example usage
 if __name__ == "__main__":